@@ -8,15 +8,20 @@ validated against the Pydantic schema in real time.
 """
 
 import ast
+import json
 import logging
+import operator
 import re
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
 from inspect import isclass
-from types import NoneType
+from types import NoneType, UnionType
 from typing import (
     Annotated,
     Any,
     Callable,
+    Iterator,
     Optional,
     Sequence,
     TypeVar,
@@ -25,13 +30,15 @@ from typing import (
     get_args,
     get_origin,
 )
+from weakref import WeakKeyDictionary
 
-import yaml
-from pydantic import BaseModel, Field, ValidationError, create_model
+from annotated_types import Ge, Gt, Le, Lt
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
 from pydantic.fields import FieldInfo
 from pydantic_core import PydanticUndefined
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
+    QApplication,
     QCheckBox,
     QComboBox,
     QDoubleSpinBox,
@@ -56,6 +63,8 @@ from xopt.generators.bayesian.turbo import TurboController
 from xopt.numerical_optimizer import NumericalOptimizer
 from xopt.vocs import VOCS
 
+from badger.utils import BlockSignalsContext
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,20 +74,25 @@ T = TypeVar("T")
 TUPLE_PATTERN = re.compile(r"\((.*?,.*?)\)")
 
 
-class CustomSafeLoader(yaml.SafeLoader):
-    def __init__(self, stream: Any) -> None:
-        super().__init__(stream)
-        self.add_constructor("tag:yaml.org,2002:str", type(self).tuple_constructor)
-
-    @staticmethod
-    def tuple_constructor(loader: Any, node: yaml.ScalarNode) -> Any:
-        value = loader.construct_scalar(node)
+def _parse_tuple_strings(value: Any) -> Any:
+    # JSON has no tuple literal, so tuples round-trip as "(a, b)" strings.
+    if isinstance(value, str):
         if TUPLE_PATTERN.match(value):
             try:
                 return ast.literal_eval(value)
             except Exception:
                 pass
-        return value
+    elif isinstance(value, list):
+        return [_parse_tuple_strings(v) for v in value]
+    return value
+
+
+def _tuple_object_hook(obj: dict[str, Any]) -> dict[Any, Any]:
+    return {_parse_tuple_strings(k): _parse_tuple_strings(v) for k, v in obj.items()}
+
+
+def _load_parameters(parameters: str) -> Any:
+    return json.loads(parameters, object_hook=_tuple_object_hook)
 
 
 def convert_to_type(value: Any, type: Callable[[Any], T]) -> T:
@@ -90,125 +104,119 @@ def convert_to_type(value: Any, type: Callable[[Any], T]) -> T:
         raise TypeError(f"Cannot convert {value} to {type}")
 
 
+def _widget_handler(
+    handlers: dict[type, Callable[..., Any]], widget: Any
+) -> Callable[..., Any] | None:
+    # Exact type first; walking the MRO keeps subclasses working
+    for cls in type(widget).__mro__:
+        handler = handlers.get(cls)
+        if handler is not None:
+            return handler
+    return None
+
+
+def _set_text(widget: QLabel | QLineEdit, value: Any) -> None:
+    widget.setText("null" if value is None else str(value))
+
+
+def _set_float(widget: QDoubleSpinBox, value: Any) -> None:
+    if value is None and widget.property("badger_nullable"):
+        widget.setValue(widget.minimum())
+    else:
+        widget.setValue(convert_to_type(value, float))
+
+
+def _set_int(widget: QSpinBox, value: Any) -> None:
+    if value is None and widget.property("badger_nullable"):
+        widget.setValue(widget.minimum())
+    else:
+        widget.setValue(convert_to_type(value, int))
+
+
+def _set_checked(widget: QCheckBox, value: Any) -> None:
+    if value is None and widget.property("badger_nullable"):
+        widget.setCheckState(Qt.CheckState.PartiallyChecked)
+    else:
+        widget.setChecked(convert_to_type(value, bool))
+
+
+BASIC_WIDGET_SETTERS: dict[type, Callable[[Any, Any], None]] = {
+    QLabel: _set_text,
+    QLineEdit: _set_text,
+    QDoubleSpinBox: _set_float,
+    QSpinBox: _set_int,
+    QCheckBox: _set_checked,
+}
+
+
 def _set_value_for_basic_widget(
     widget: QWidget,
     value: str | float | int | bool | None,
 ) -> None:
-    nullable = bool(widget.property("badger_nullable"))
-    if isinstance(widget, QLabel) or isinstance(widget, QLineEdit):
-        widget.setText("null" if value is None else str(value))
-    elif isinstance(widget, QDoubleSpinBox):
-        if value is None and nullable:
-            widget.setValue(widget.minimum())
-        else:
-            widget.setValue(convert_to_type(value, float))
-    elif isinstance(widget, QSpinBox):
-        if value is None and nullable:
-            widget.setValue(widget.minimum())
-        else:
-            widget.setValue(convert_to_type(value, int))
-    elif isinstance(widget, QCheckBox):
-        if value is None and nullable:
-            widget.setCheckState(Qt.CheckState.PartiallyChecked)
-        else:
-            widget.setChecked(convert_to_type(value, bool))
+    setter = _widget_handler(BASIC_WIDGET_SETTERS, widget)
+    if setter is not None:
+        setter(widget, value)
+
+
+# Keyed weakly, set_params_from_dict creates a new model class on each call
+_MODEL_KINDS: "WeakKeyDictionary[type, str | None]" = WeakKeyDictionary()
+
+
+def _model_kind(main: Any) -> str | None:
+    """
+    Classify a resolved type for resolve_qt.
+
+    Returns "choice" for models picked from a combo box (turbo controllers,
+    numerical optimizers and BAX algorithms), "model" for other models that
+    become a subtree, and None for anything else, including non-class types
+    such as typing.Union.
+    """
+    if not isclass(main):
+        return None
+    try:
+        return _MODEL_KINDS[main]
+    except KeyError:
+        pass
+
+    kind: str | None = None
+    if issubclass(main, (TurboController, NumericalOptimizer, Algorithm)):
+        kind = "choice"
+    elif issubclass(main, BaseModel):
+        kind = "model"
+    _MODEL_KINDS[main] = kind
+    return kind
+
+
+# Preferred types when a Union has no model member, best first
+TYPE_RANK: dict[Any, int] = {dict: 0, list: 1, str: 2, float: 3, int: 4, bool: 5}
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BadgerResolvedType:
     main: type[Any] | None = None
     nullable: bool = False
     subtype: Optional["BadgerResolvedType | list[BadgerResolvedType]"] = None
 
+    # Resolved types are memoized per annotation and shared between fields,
+    # which is why the dataclass is frozen. Annotations that can't be hashed
+    # (unhashable Annotated metadata) are resolved without the cache.
     @classmethod
     def find_primary(
         cls, annotations: tuple[Any, ...]
     ) -> Optional["BadgerResolvedType"]:
-        if len(annotations) == 0:
-            return None
-
-        resolved = [
-            BadgerResolvedType.resolve(annotation) for annotation in annotations
-        ]
-        for r in resolved:
-            if r.main is None:
-                continue
-            if not isclass(r.main):
-                continue
-            if issubclass(r.main, BaseModel):
-                return r
-
-        priority: list[type] = [dict, list, str, float, int, bool]
-        for p in priority:
-            for r in resolved:
-                if p == r.main:
-                    return r
-
-        return resolved[0]
+        try:
+            return _find_primary(annotations)
+        except TypeError:
+            return _find_primary.__wrapped__(annotations)
 
     @classmethod
     def resolve(
         cls, annotation: type[Any] | Union[Any, None] | None
     ) -> "BadgerResolvedType":
-        origin: type[Any] | Union[Any, None] | None = get_origin(annotation)
-        args = get_args(annotation)
-        nullable = False
-
-        if origin is None:
-            origin = annotation
-
-        if len(args) == 0:
-            return BadgerResolvedType(main=annotation)
-
-        if origin == Annotated:
-            return BadgerResolvedType.resolve(args[0])
-
-        if origin == Union:
-            if NoneType in args:
-                origin = Optional
-                args = tuple(arg for arg in args if arg != NoneType)
-            else:
-                if len(args) == 1:
-                    origin = args[0]
-                    args = ()
-                    nullable = True
-
-                    if origin is not None:
-                        resolved = BadgerResolvedType.resolve(origin)
-                        resolved.nullable = True
-                        return resolved
-                elif len(args) > 1:
-                    primary = BadgerResolvedType.find_primary(args)
-                    return BadgerResolvedType(
-                        main=origin,
-                        nullable=nullable,
-                        subtype=primary,
-                    )
-
-        if origin == Optional:
-            origin = args[0]
-            args = ()
-            nullable = True
-
-            if origin is not None:
-                resolved = BadgerResolvedType.resolve(origin)
-                resolved.nullable = True
-                return resolved
-
-        # Dicts have two subtypes, special case
-        if origin is dict:
-            if len(args) == 2:
-                return BadgerResolvedType(
-                    main=origin,
-                    subtype=[BadgerResolvedType.resolve(arg) for arg in args],
-                )
-            return BadgerResolvedType(main=str)
-
-        return BadgerResolvedType(
-            main=origin,
-            nullable=nullable,
-            subtype=BadgerResolvedType.find_primary(args),
-        )
+        try:
+            return _resolve(annotation)
+        except TypeError:
+            return _resolve.__wrapped__(annotation)
 
     @classmethod
     def resolve_qt(
@@ -217,227 +225,202 @@ class BadgerResolvedType:
         default: float | int | bool | dict[str, Any] | list[Any] | None = None,
         editor_info: tuple["BadgerPydanticEditor", QTreeWidgetItem] | None = None,
     ) -> QWidget | None:
-        resolved_type = BadgerResolvedType.resolve(annotation)
-        widget: QWidget | None = None
+        return cls.resolve_qt_from(
+            BadgerResolvedType.resolve(annotation), default, editor_info
+        )
+
+    @classmethod
+    def resolve_qt_from(
+        cls,
+        resolved_type: "BadgerResolvedType",
+        default: float | int | bool | dict[str, Any] | list[Any] | None = None,
+        editor_info: tuple["BadgerPydanticEditor", QTreeWidgetItem] | None = None,
+    ) -> QWidget | None:
+        """Like resolve_qt, for callers that already resolved the annotation."""
+        widget: QWidget
 
-        if resolved_type.main is None:
+        factory = QT_WIDGET_FACTORIES.get(resolved_type.main)
+        if factory is not None:
+            widget = factory(resolved_type, default)
+        elif resolved_type.main is None:
             widget = QLineEdit()
             widget.setText("null")
-        elif issubclass(resolved_type.main, BaseModel):
-            if issubclass(resolved_type.main, TurboController):
-                widget = QComboBox()
-            elif issubclass(resolved_type.main, NumericalOptimizer):
-                widget = QComboBox()
-            elif issubclass(resolved_type.main, Algorithm):
-                widget = QComboBox()
-            else:
+        else:
+            kind = _model_kind(resolved_type.main)
+            if kind == "model":
                 return None
-            if resolved_type.nullable:
-                widget.addItem("null", {})
-
-            if default is None:
-                default = {"name": "null"}
-            if isinstance(default, dict) and "name" in default:
-                if (index := widget.findText(default["name"])) >= 0:
-                    widget.setCurrentIndex(index)
-        elif resolved_type.main == NoneType:
-            widget = QLabel()
-            widget.setText("null")
-        elif resolved_type.main is dict:
-            subtypes = resolved_type.subtype
-            if subtypes is None:
-                raise ValueError("Dict type must have subtypes")
-            if not isinstance(subtypes, list) or len(subtypes) != 2:
-                raise ValueError("Dict type must have two subtypes")
-
-            primary_type = subtypes[0]
-            secondary_type = subtypes[1]
-
-            if primary_type.main is None or secondary_type.main is None:
-                raise ValueError("Dict subtypes must be basic types")
-
-            widget = BadgerListEditor(primary_type.main, secondary_type.main)
-
-            if default is not None and isinstance(default, dict):
-                for k, v in default.items():
-                    row = widget.add_widget()
-                    _set_value_for_basic_widget(row.parameter1(), k)
-                    _set_value_for_basic_widget(row.parameter2(), v)
-
-            if editor_info is not None:
-                widget.listChanged.connect(lambda: handle_changed(editor_info))
-        elif resolved_type.main is list:
-            if resolved_type.subtype is None:
-                raise ValueError("List type must have a subtype")
-            if isinstance(resolved_type.subtype, list):
-                primary_type = resolved_type.subtype[0]
-                secondary_type = (
-                    resolved_type.subtype[1] if len(resolved_type.subtype) > 1 else None
+            elif kind == "choice":
+                widget = _choice_combo_box(resolved_type, default)
+            else:
+                widget = _line_edit(resolved_type, default)
+
+        if editor_info is not None:
+            signal_name = CHANGE_SIGNALS.get(type(widget))
+            if signal_name is not None:
+                getattr(widget, signal_name).connect(
+                    partial(handle_changed, editor_info)
                 )
 
-            else:
-                primary_type = resolved_type.subtype
-                secondary_type = None
-            if primary_type.main is None:
-                raise ValueError("List subtype must be a basic type")
-            widget = BadgerListEditor(
-                primary_type.main, secondary_type.main if secondary_type else None
+        widget.setProperty("badger_nullable", resolved_type.nullable)
+        return widget
+
+
+@lru_cache(maxsize=1024)
+def _find_primary(annotations: tuple[Any, ...]) -> BadgerResolvedType | None:
+    if len(annotations) == 0:
+        return None
+
+    # The first model wins outright, otherwise the first type in TYPE_RANK
+    # order, otherwise the first annotation
+    best: BadgerResolvedType | None = None
+    best_rank = len(TYPE_RANK) + 1
+    for annotation in annotations:
+        resolved = BadgerResolvedType.resolve(annotation)
+        if _model_kind(resolved.main) is not None:
+            return resolved
+        rank = TYPE_RANK.get(resolved.main, len(TYPE_RANK))
+        if rank < best_rank:
+            best, best_rank = resolved, rank
+
+    return best
+
+
+@lru_cache(maxsize=1024)
+def _resolve(annotation: type[Any] | Union[Any, None] | None) -> BadgerResolvedType:
+    origin: type[Any] | Union[Any, None] | None = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is None:
+        origin = annotation
+
+    if len(args) == 0:
+        return BadgerResolvedType(main=annotation)
+
+    if origin == Annotated:
+        return BadgerResolvedType.resolve(args[0])
+
+    # X | Y unions have their own origin type, but mean the same thing
+    if origin is Union or origin is UnionType:
+        non_none = tuple(arg for arg in args if arg is not NoneType)
+        if len(non_none) < len(args):
+            # Optional: the first other member decides the widget
+            return replace(BadgerResolvedType.resolve(non_none[0]), nullable=True)
+        return BadgerResolvedType(
+            main=Union, subtype=BadgerResolvedType.find_primary(args)
+        )
+
+    # Dicts have two subtypes, special case
+    if origin is dict:
+        if len(args) == 2:
+            return BadgerResolvedType(
+                main=origin,
+                subtype=[BadgerResolvedType.resolve(arg) for arg in args],
             )
+        return BadgerResolvedType(main=str)
 
-            if default is not None and isinstance(default, list):
-                for v in default:
-                    row = widget.add_widget()
-                    _set_value_for_basic_widget(row.parameter1(), v)
-
-            if editor_info is not None:
-                widget.listChanged.connect(lambda: handle_changed(editor_info))
-        elif resolved_type.main is float:
-            widget = QDoubleSpinBox()
-            widget.setRange(float("-inf"), float("inf"))
-            widget.setDecimals(6)
-            if resolved_type.nullable:
-                # The minimum value doubles as the "null" sentinel.
-                widget.setSpecialValueText("null")
-            if default is not None:
-                widget.setValue(convert_to_type(default, float))
-            elif resolved_type.nullable:
-                widget.setValue(widget.minimum())
-            else:
-                widget.setValue(0.0)
-
-            if editor_info is not None:
-                widget.valueChanged.connect(lambda: handle_changed(editor_info))
-        elif resolved_type.main is int:
-            widget = QSpinBox()
-            widget.setRange(-(2**31), 2**31 - 1)  # int32 min/max
-            if resolved_type.nullable:
-                # The minimum value doubles as the "null" sentinel.
-                widget.setSpecialValueText("null")
-            if default is not None:
-                widget.setValue(convert_to_type(default, int))
-            elif resolved_type.nullable:
-                widget.setValue(widget.minimum())
-            else:
-                widget.setValue(0)
-
-            if editor_info is not None:
-                widget.valueChanged.connect(lambda: handle_changed(editor_info))
-        elif resolved_type.main is bool:
-            widget = QCheckBox()
-            if resolved_type.nullable:
-                widget.setTristate(True)
-            if default is not None:
-                widget.setChecked(convert_to_type(default, bool))
-            elif resolved_type.nullable:
-                widget.setCheckState(Qt.CheckState.PartiallyChecked)
-            else:
-                widget.setChecked(False)
+    return BadgerResolvedType(
+        main=origin, subtype=BadgerResolvedType.find_primary(args)
+    )
 
-            if editor_info is not None:
-                widget.stateChanged.connect(lambda: handle_changed(editor_info))
-        else:
-            widget = QLineEdit()
-            if default is None:
-                widget.setText("null")
-            else:
-                widget.setText(str(default))
 
-            if editor_info is not None:
-                widget.textChanged.connect(lambda: handle_changed(editor_info))
+def handle_changed(
+    editor_info: tuple["BadgerPydanticEditor", QTreeWidgetItem], *_args: Any
+) -> None:
+    # Connected through partial, so the signal's own arguments land in _args
+    tree_widget, item = editor_info
+    tree_widget.schedule_validate_item(item)
 
-        widget.setProperty("badger_nullable", resolved_type.nullable)
-        return widget
 
+def _spin_box_to_yaml(widget: QSpinBox | QDoubleSpinBox) -> str:
+    if widget.property("badger_nullable") and widget.value() == widget.minimum():
+        return "null"
+    # json.dumps rather than str so inf/nan come out as JSON literals
+    return json.dumps(widget.value())
 
-def handle_changed(editor_info: tuple["BadgerPydanticEditor", QTreeWidgetItem]) -> None:
-    tree_widget, _ = editor_info
-    tree_widget.validate()
 
+def _check_box_to_yaml(widget: QCheckBox) -> str:
+    if (
+        widget.property("badger_nullable")
+        and widget.checkState() == Qt.CheckState.PartiallyChecked
+    ):
+        return "null"
+    return "true" if widget.isChecked() else "false"
 
-def _qt_widget_to_yaml_value(widget: Any) -> str | None:
-    if isinstance(widget, QTreeWidget):
-        return None
-    elif isinstance(widget, BadgerListEditor):
-        return widget.get_parameters_yaml()
-    elif isinstance(widget, QSpinBox) or isinstance(widget, QDoubleSpinBox):
-        if widget.property("badger_nullable") and widget.value() == widget.minimum():
-            return "null"
-        return str(widget.value())
-    elif isinstance(widget, QCheckBox):
-        if (
-            widget.property("badger_nullable")
-            and widget.checkState() == Qt.CheckState.PartiallyChecked
-        ):
-            return "null"
-        return "true" if widget.isChecked() else "false"
-    elif isinstance(widget, QComboBox):
-        if widget.currentText() == "null":
-            return "null"
-        return f'"{widget.currentText()}"'
-    elif isinstance(widget, (QLabel, QLineEdit)):
-        text = widget.text()
-        if text == "null" or text == "None" or text == "":
-            return "null"
-        else:
-            return ('"' + text + '"') if isinstance(widget, QLineEdit) else text
+
+def _combo_box_to_yaml(widget: QComboBox) -> str:
+    if widget.currentText() == "null":
+        return "null"
+    return json.dumps(widget.currentText(), ensure_ascii=False)
+
+
+def _line_edit_to_yaml(widget: QLineEdit) -> str:
+    text = widget.text()
+    if text == "null" or text == "None" or text == "":
+        return "null"
+    return json.dumps(text, ensure_ascii=False)
+
+
+def _label_to_yaml(widget: QLabel) -> str:
+    # QLabels only stand in for NoneType fields, so they always hold null
     return "null"
 
 
+def _qt_widget_to_yaml_value(widget: Any) -> str | None:
+    reader = _widget_handler(WIDGET_YAML_READERS, widget)
+    if reader is None:
+        return "null"
+    return reader(widget)
+
+
 def _qt_widgets_to_yaml_recurse(
     table: QTreeWidget,
     item: QTreeWidgetItem | None,
     value_col: int = 1,
 ) -> str:
-    out: str = "{"
+    # Collect the members and join once, so nesting doesn't recopy strings
+    members: list[str] = []
     if item is not None:
         for i in range(item.childCount()):
             child_item = item.child(i)
             if child_item is None:
                 continue
 
-            child_item_text = child_item.text(0)
-            out += f'"{child_item_text}":'
+            key = json.dumps(child_item.text(0), ensure_ascii=False)
             widget = table.itemWidget(child_item, value_col)
 
             if child_item.childCount() > 0:
-                out += _qt_widgets_to_yaml_recurse(table, child_item)
+                value = _qt_widgets_to_yaml_recurse(table, child_item, value_col)
             elif widget is None:
-                out += "null"
+                value = "null"
             else:
                 yaml_value = _qt_widget_to_yaml_value(widget)
-                if yaml_value is None:
-                    out += "null"
-                else:
-                    out += yaml_value
+                value = "null" if yaml_value is None else yaml_value
 
-            if i < item.childCount() - 1:
-                out += ","
+            members.append(f"{key}:{value}")
+
+    return "{" + ",".join(members) + "}"
+
+
+def _spin_box_to_value(widget: QSpinBox | QDoubleSpinBox) -> float | int | None:
+    if widget.property("badger_nullable") and widget.value() == widget.minimum():
+        return None
+    return widget.value()
 
-    out += "}"
-    return out
+
+def _check_box_to_value(widget: QCheckBox) -> bool | None:
+    if (
+        widget.property("badger_nullable")
+        and widget.checkState() == Qt.CheckState.PartiallyChecked
+    ):
+        return None
+    return widget.isChecked()
 
 
 def _qt_widget_to_value(widget: Any) -> Any:
-    if isinstance(widget, QTreeWidget):
+    reader = _widget_handler(WIDGET_VALUE_READERS, widget)
+    if reader is None:
         return None
-    elif isinstance(widget, BadgerListEditor):
-        return widget.get_parameters_dict()
-    elif isinstance(widget, QSpinBox) or isinstance(widget, QDoubleSpinBox):
-        if widget.property("badger_nullable") and widget.value() == widget.minimum():
-            return None
-        return widget.value()
-    elif isinstance(widget, QCheckBox):
-        if (
-            widget.property("badger_nullable")
-            and widget.checkState() == Qt.CheckState.PartiallyChecked
-        ):
-            return None
-        return widget.isChecked()
-    elif isinstance(widget, QComboBox):
-        return widget.currentText()
-    elif isinstance(widget, (QLabel, QLineEdit)):
-        return widget.text()
-    return None
+    return reader(widget)
 
 
 def _qt_widgets_to_values_recurse(
@@ -456,7 +439,7 @@ def _qt_widgets_to_values_recurse(
             widget = table.itemWidget(child_item, value_col)
 
             if child_item.childCount() > 0:
-                out[key] = _qt_widgets_to_values_recurse(table, child_item)
+                out[key] = _qt_widgets_to_values_recurse(table, child_item, value_col)
             elif widget is None:
                 out[key] = None
             else:
@@ -479,9 +462,7 @@ class BadgerListItem(QWidget):
                 QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
             )
             if isinstance(self.parameter_value, QLineEdit):
-                self.parameter_value.editingFinished.connect(
-                    lambda: self.editor.listChanged.emit()
-                )
+                self.parameter_value.editingFinished.connect(self.editor.listChanged)
 
         layout.addWidget(self.parameter_value)
         self.parameter_value2 = None
@@ -495,9 +476,7 @@ class BadgerListItem(QWidget):
                 )
 
                 if isinstance(self.parameter_value2, QDoubleSpinBox):
-                    self.parameter_value2.valueChanged.connect(
-                        lambda: self.editor.listChanged.emit()
-                    )
+                    self.parameter_value2.valueChanged.connect(self.editor.listChanged)
             # Set fixed width for QLineEdit to avoid excessive stretching for dictionary keys
             if isinstance(self.parameter_value, QLineEdit):
                 self.parameter_value.setFixedWidth(100)
@@ -515,6 +494,7 @@ class BadgerListItem(QWidget):
         return self.parameter_value2
 
     def remove(self) -> None:
+        self.editor.remove_widget(self)
         self.setParent(None)
         self.deleteLater()
         self.editor.listChanged.emit()
@@ -532,6 +512,8 @@ class BadgerListEditor(QWidget):
         super().__init__(parent)
         self.widget_type = widget_type
         self.widget_type2 = widget_type2
+        # Rows in display order, so reads don't have to walk the layout
+        self._items: list[BadgerListItem] = []
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 4, 0, 4)
@@ -549,7 +531,7 @@ class BadgerListEditor(QWidget):
 
         add_button = QPushButton("Add")
         add_button.setFixedWidth(90)
-        add_button.clicked.connect(lambda: self.handle_button_click())
+        add_button.clicked.connect(self.handle_button_click)
         button_layout.addWidget(add_button)
 
         layout.addLayout(button_layout)
@@ -560,53 +542,368 @@ class BadgerListEditor(QWidget):
     def add_widget(self) -> BadgerListItem:
         widget = BadgerListItem(self)
         self.list_layout.addWidget(widget)
+        self._items.append(widget)
         self.listChanged.emit()
         return widget
 
+    def remove_widget(self, widget: BadgerListItem) -> None:
+        self.list_layout.removeWidget(widget)
+        self._items.remove(widget)
+
+    def list_items(self) -> list[BadgerListItem]:
+        return list(self._items)
+
     def get_parameters_yaml(self) -> str | None:
-        child_values: list[str | None] = [
-            _qt_widget_to_yaml_value(child.parameter_value)
-            for child in self.list_container.children()
-            if isinstance(child, BadgerListItem)
-        ]
-        if len(child_values) == 0 and self.property("badger_nullable"):
+        items = self._items
+        if len(items) == 0 and self.property("badger_nullable"):
             return "null"
 
         if self.widget_type2 is None:
+            child_values = [
+                _qt_widget_to_yaml_value(item.parameter_value) for item in items
+            ]
             values = [value for value in child_values if value is not None]
             return "[" + ",".join(values) + "]"
         else:
-            child_values2 = [
-                _qt_widget_to_yaml_value(child.parameter_value2)
-                for child in self.list_container.children()
-                if isinstance(child, BadgerListItem)
-            ]
-            return (
-                "{"
-                + ",".join(
-                    [str(k) + ":" + str(v) for k, v in zip(child_values, child_values2)]
+            # JSON object keys must be strings, whatever the key widget holds.
+            # JSON has no null key either, so rows without a key are skipped
+            members: list[str] = []
+            for item in items:
+                if _qt_widget_to_yaml_value(item.parameter_value) == "null":
+                    continue
+                key = json.dumps(
+                    str(_qt_widget_to_value(item.parameter_value)), ensure_ascii=False
                 )
-                + "}"
-            )
+                value = _qt_widget_to_yaml_value(item.parameter_value2)
+                members.append(f"{key}:{value}")
+            return "{" + ",".join(members) + "}"
 
     def get_parameters_dict(self) -> dict[str, Any] | None:
-        child_values: list[str | None] = [
-            _qt_widget_to_value(child.parameter_value)
-            for child in self.list_container.children()
-            if isinstance(child, BadgerListItem)
-        ]
-        if len(child_values) == 0 and self.property("badger_nullable"):
+        items = self._items
+        if len(items) == 0 and self.property("badger_nullable"):
             return None
 
         if self.widget_type2 is None:
+            child_values = [_qt_widget_to_value(item.parameter_value) for item in items]
             return [value for value in child_values if value is not None]
         else:
-            child_values2 = [
-                _qt_widget_to_value(child.parameter_value2)
-                for child in self.list_container.children()
-                if isinstance(child, BadgerListItem)
-            ]
-            return {k: v for k, v in zip(child_values, child_values2)}
+            return {
+                _qt_widget_to_value(item.parameter_value): _qt_widget_to_value(
+                    item.parameter_value2
+                )
+                for item in items
+            }
+
+
+def _collection_editor(
+    resolved_type: BadgerResolvedType,
+    default: Any,
+) -> BadgerListEditor:
+    # Dicts edit as key/value rows, lists as single-value rows
+    subtype = resolved_type.subtype
+    is_dict = resolved_type.main is dict
+    if is_dict:
+        if subtype is None:
+            raise ValueError("Dict type must have subtypes")
+        if not isinstance(subtype, list) or len(subtype) != 2:
+            raise ValueError("Dict type must have two subtypes")
+        if subtype[0].main is None or subtype[1].main is None:
+            raise ValueError("Dict subtypes must be basic types")
+    elif subtype is None:
+        raise ValueError("List type must have a subtype")
+
+    subtypes = subtype if isinstance(subtype, list) else [subtype]
+    primary_type = subtypes[0]
+    secondary_type = subtypes[1] if len(subtypes) > 1 else None
+    if primary_type.main is None:
+        raise ValueError("List subtype must be a basic type")
+
+    editor = BadgerListEditor(
+        primary_type.main, secondary_type.main if secondary_type else None
+    )
+
+    if is_dict and isinstance(default, dict):
+        for k, v in default.items():
+            row = editor.add_widget()
+            _set_value_for_basic_widget(row.parameter1(), k)
+            _set_value_for_basic_widget(row.parameter2(), v)
+    elif not is_dict and isinstance(default, list):
+        for v in default:
+            row = editor.add_widget()
+            _set_value_for_basic_widget(row.parameter1(), v)
+
+    return editor
+
+
+def _choice_combo_box(resolved_type: BadgerResolvedType, default: Any) -> QComboBox:
+    # The choices are filled in by initialize_special_field
+    widget = QComboBox()
+    if resolved_type.nullable:
+        widget.addItem("null", {})
+
+    if default is None:
+        default = {"name": "null"}
+    if isinstance(default, dict) and "name" in default:
+        if (index := widget.findText(default["name"])) >= 0:
+            widget.setCurrentIndex(index)
+    return widget
+
+
+def _null_label(resolved_type: BadgerResolvedType, default: Any) -> QLabel:
+    widget = QLabel()
+    widget.setText("null")
+    return widget
+
+
+def _double_spin_box(resolved_type: BadgerResolvedType, default: Any) -> QDoubleSpinBox:
+    widget = QDoubleSpinBox()
+    widget.setRange(float("-inf"), float("inf"))
+    widget.setDecimals(6)
+    if resolved_type.nullable:
+        # The minimum value doubles as the "null" sentinel.
+        widget.setSpecialValueText("null")
+    if default is not None:
+        widget.setValue(convert_to_type(default, float))
+    elif resolved_type.nullable:
+        widget.setValue(widget.minimum())
+    else:
+        widget.setValue(0.0)
+    return widget
+
+
+def _spin_box(resolved_type: BadgerResolvedType, default: Any) -> QSpinBox:
+    widget = QSpinBox()
+    widget.setRange(-(2**31), 2**31 - 1)  # int32 min/max
+    if resolved_type.nullable:
+        # The minimum value doubles as the "null" sentinel.
+        widget.setSpecialValueText("null")
+    if default is not None:
+        widget.setValue(convert_to_type(default, int))
+    elif resolved_type.nullable:
+        widget.setValue(widget.minimum())
+    else:
+        widget.setValue(0)
+    return widget
+
+
+def _check_box(resolved_type: BadgerResolvedType, default: Any) -> QCheckBox:
+    widget = QCheckBox()
+    if resolved_type.nullable:
+        widget.setTristate(True)
+    if default is not None:
+        widget.setChecked(convert_to_type(default, bool))
+    elif resolved_type.nullable:
+        widget.setCheckState(Qt.CheckState.PartiallyChecked)
+    else:
+        widget.setChecked(False)
+    return widget
+
+
+def _line_edit(resolved_type: BadgerResolvedType, default: Any) -> QLineEdit:
+    widget = QLineEdit()
+    if default is None:
+        widget.setText("null")
+    else:
+        widget.setText(str(default))
+    return widget
+
+
+# Widget builders by resolved type, models and anything else are handled
+# in resolve_qt
+QT_WIDGET_FACTORIES: dict[Any, Callable[[BadgerResolvedType, Any], QWidget]] = {
+    float: _double_spin_box,
+    int: _spin_box,
+    bool: _check_box,
+    dict: _collection_editor,
+    list: _collection_editor,
+    NoneType: _null_label,
+}
+
+# Signals that trigger validation, for the widgets resolve_qt builds
+CHANGE_SIGNALS: dict[type, str] = {
+    QDoubleSpinBox: "valueChanged",
+    QSpinBox: "valueChanged",
+    QCheckBox: "stateChanged",
+    QLineEdit: "textChanged",
+    BadgerListEditor: "listChanged",
+}
+
+
+WIDGET_YAML_READERS: dict[type, Callable[[Any], str | None]] = {
+    QTreeWidget: lambda widget: None,
+    BadgerListEditor: BadgerListEditor.get_parameters_yaml,
+    QSpinBox: _spin_box_to_yaml,
+    QDoubleSpinBox: _spin_box_to_yaml,
+    QCheckBox: _check_box_to_yaml,
+    QComboBox: _combo_box_to_yaml,
+    QLabel: _label_to_yaml,
+    QLineEdit: _line_edit_to_yaml,
+}
+
+WIDGET_VALUE_READERS: dict[type, Callable[[Any], Any]] = {
+    QTreeWidget: lambda widget: None,
+    BadgerListEditor: BadgerListEditor.get_parameters_dict,
+    QSpinBox: _spin_box_to_value,
+    QDoubleSpinBox: _spin_box_to_value,
+    QCheckBox: _check_box_to_value,
+    QComboBox: QComboBox.currentText,
+    QLabel: QLabel.text,
+    QLineEdit: QLineEdit.text,
+}
+
+# Scalar types whose widgets already guarantee the value type
+INTERACTIVE_TYPES = (bool, int, float, str, NoneType)
+
+# Field constraints checked by hand in interactive validation, with the
+# wording pydantic uses for the same error
+BOUND_CHECKS: tuple[tuple[type, Callable[[Any, Any], bool], str], ...] = (
+    (Gt, operator.gt, "greater than"),
+    (Ge, operator.ge, "greater than or equal to"),
+    (Lt, operator.lt, "less than"),
+    (Le, operator.le, "less than or equal to"),
+)
+
+
+def _supports_interactive_validation(model_class: type[BaseModel]) -> bool:
+    """
+    Whether edits to model_class can be checked without running pydantic.
+
+    Only models without custom validators whose fields (besides vocs) are
+    basic scalars with at most numeric bounds qualify.
+    """
+    decorators = model_class.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    ):
+        return False
+
+    for name, field_info in model_class.model_fields.items():
+        if name == "vocs":
+            continue
+        resolved = BadgerResolvedType.resolve(field_info.annotation)
+        if resolved.main not in INTERACTIVE_TYPES:
+            return False
+        bound_types = tuple(bound_type for bound_type, _, _ in BOUND_CHECKS)
+        if not all(isinstance(m, bound_types) for m in field_info.metadata):
+            return False
+
+    return True
+
+
+def _check_scalar_fields(
+    model_class: type[BaseModel], parameters: dict[str, Any]
+) -> list[tuple[tuple[int | str, ...], str]]:
+    errors: list[tuple[tuple[int | str, ...], str]] = []
+    for name, field_info in model_class.model_fields.items():
+        if name == "vocs" or name not in parameters:
+            continue
+
+        value = parameters[name]
+        if value is None:
+            resolved = BadgerResolvedType.resolve(field_info.annotation)
+            if not resolved.nullable and resolved.main is not NoneType:
+                errors.append(
+                    ((name,), f"Input should be a valid {resolved.main.__name__}")
+                )
+            continue
+
+        for constraint in field_info.metadata:
+            for bound_type, compare, description in BOUND_CHECKS:
+                if not isinstance(constraint, bound_type):
+                    continue
+                bound = getattr(constraint, bound_type.__name__.lower())
+                if not compare(value, bound):
+                    errors.append(((name,), f"Input should be {description} {bound}"))
+
+    return errors
+
+
+@lru_cache(maxsize=64)
+def _compatible_classes(
+    model_class: type[BaseModel], field_name: str
+) -> tuple[type[BaseModel] | None, ...]:
+    # The get_compatible_* lookups walk xopt's registries, and their result
+    # only depends on the generator class
+    if field_name == "numerical_optimizer":
+        if not issubclass(model_class, BayesianGenerator):
+            raise ValueError("Generator does not support numerical optimizers.")
+        return tuple(model_class.get_compatible_numerical_optimizers())
+    elif field_name == "turbo_controller":
+        if not issubclass(model_class, BayesianGenerator):
+            raise ValueError("Generator does not support turbo controllers.")
+        return tuple(model_class.get_compatible_turbo_controllers())
+    elif field_name == "algorithm":
+        if not issubclass(model_class, BaxGenerator):
+            raise ValueError("Generator does not support algorithms.")
+        return tuple(model_class.get_compatible_algorithms())
+    else:
+        raise ValueError(f"Field name {field_name} is not recognized.")
+
+
+@lru_cache(maxsize=64)
+def _compatible_classes_by_name(
+    model_class: type[BaseModel], field_name: str
+) -> dict[str, type[BaseModel]]:
+    by_name: dict[str, type[BaseModel]] = {}
+    for opt in _compatible_classes(model_class, field_name):
+        if opt is not None:
+            by_name.setdefault(opt.model_fields["name"].default, opt)
+    return by_name
+
+
+@lru_cache(maxsize=64)
+def _split_class_fields(
+    pydantic_class: type[BaseModel],
+    fields_to_remove: tuple[str, ...],
+    included: frozenset[str] | None,
+) -> tuple[dict[str, FieldInfo], dict[str, FieldInfo]]:
+    # Every generator switch and combo box change splits the same few classes,
+    # so the split is shared. Callers must not modify the returned dicts.
+    filtered_class_fields = {
+        k: v
+        for k, v in pydantic_class.model_fields.items()
+        if k not in fields_to_remove and (included is None or k in included)
+    }
+
+    removed_class_fields = {
+        k: v for k, v in pydantic_class.model_fields.items() if k in fields_to_remove
+    }
+
+    return filtered_class_fields, removed_class_fields
+
+
+@lru_cache(maxsize=256)
+def _field_adapter(owner: type[BaseModel], field_name: str) -> TypeAdapter[Any] | None:
+    # Fields with validators of their own can only be checked on the model
+    field_info = owner.model_fields.get(field_name)
+    if field_info is None:
+        return None
+
+    decorators = owner.__pydantic_decorators__
+    for decorator in [
+        *decorators.validators.values(),
+        *decorators.field_validators.values(),
+    ]:
+        if field_name in decorator.info.fields or "*" in decorator.info.fields:
+            return None
+
+    return TypeAdapter(Annotated[field_info.annotation, field_info])
+
+
+ERROR_STYLESHEET = '*[badger_error="true"] { border: 2px dashed red }'
+
+
+def _set_error_state(widget: QWidget, error: bool) -> None:
+    # The rule lives in the editor's stylesheet, so a repolish is enough
+    if bool(widget.property("badger_error")) == error:
+        return
+    widget.setProperty("badger_error", error)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
 
 
 class BadgerPydanticEditor(QTreeWidget):
@@ -614,6 +911,12 @@ class BadgerPydanticEditor(QTreeWidget):
     defaults: dict[str, Any] = {}
     generator_name: str = ""
     model_class: type[BaseModel] | None = None
+    # Check edits by hand while the user is typing and leave model_validate
+    # for when focus leaves the editor. Models with custom validators always
+    # run model_validate; set to False to do so for every model
+    interactive_validation: bool = True
+    # Edits within this many milliseconds of each other are checked together
+    validation_delay_ms: int = 120
 
     def __init__(
         self,
@@ -636,6 +939,95 @@ class BadgerPydanticEditor(QTreeWidget):
         )
 
         self.model_class = None
+        self.setStyleSheet(ERROR_STYLESHEET)
+        # Set when edits were only checked interactively since the last
+        # model_validate
+        self._validation_pending = False
+        # Tree items by field path, for mapping validation errors to items
+        self._path_index: dict[tuple[str, ...], QTreeWidgetItem] = {}
+        self._populating = False
+        # Items styled by update_error_styles, so only those get reset
+        self._errored_items: list[QTreeWidgetItem] = []
+        # Parameters the last full validation ran on
+        self._last_validated_parameters: str | None = None
+        # Edited items waiting for the validation timer
+        self._pending_items: list[QTreeWidgetItem] = []
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(self.validation_delay_ms)
+        self._validate_timer.timeout.connect(self._validate_pending_items)
+
+        app = QApplication.instance()
+        if app is not None:
+            cast(QApplication, app).focusChanged.connect(self._on_focus_changed)
+
+    def _on_focus_changed(self, old: QWidget | None, new: QWidget | None) -> None:
+        if not self._validation_pending or old is None or not self.isAncestorOf(old):
+            return
+        if new is not None and self.isAncestorOf(new):
+            return
+        self.validate()
+
+    @contextmanager
+    def populating(self) -> Iterator[None]:
+        """
+        Hold off repaints and tree signals while items are being (re)built.
+
+        Adding items and item widgets one at a time relayouts and repaints the
+        tree after each of them otherwise. Nested uses are no-ops.
+        """
+        if self._populating:
+            yield
+            return
+
+        self._populating = True
+        self.setUpdatesEnabled(False)
+        try:
+            with BlockSignalsContext(self):
+                yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self._populating = False
+
+    def clear(self) -> None:
+        self._validate_timer.stop()
+        self._pending_items.clear()
+        self._path_index.clear()
+        self._errored_items.clear()
+        self._last_validated_parameters = None
+        QTreeWidget.clear(self)
+
+    @staticmethod
+    def _item_path(item: QTreeWidgetItem | None) -> tuple[str, ...]:
+        path: list[str] = []
+        while item is not None:
+            path.append(item.text(0))
+            item = item.parent()
+        return tuple(reversed(path))
+
+    def _take_children(self, item: QTreeWidgetItem) -> list[QTreeWidgetItem]:
+        # Drop the index entries first, they would keep the items alive
+        path = self._item_path(item)
+        for key in [
+            key
+            for key in self._path_index
+            if len(key) > len(path) and key[: len(path)] == path
+        ]:
+            del self._path_index[key]
+        self._errored_items = [
+            errored
+            for errored in self._errored_items
+            if errored is item or not self._item_path(errored)[: len(path)] == path
+        ]
+        # The view only deletes the item widgets of the direct children, the
+        # ones further down would stay alive in the viewport
+        stack = [item.child(i) for i in range(item.childCount())]
+        while stack:
+            descendant = stack.pop()
+            if self.itemWidget(descendant, self.value_col) is not None:
+                self.removeItemWidget(descendant, self.value_col)
+            stack.extend(descendant.child(i) for i in range(descendant.childCount()))
+        return item.takeChildren()
 
     def _set_params_recurse(
         self,
@@ -643,49 +1035,54 @@ class BadgerPydanticEditor(QTreeWidget):
         fields: dict[str, FieldInfo],
         defaults: dict[str, Any] | None,
         hidden: bool,
+        owner: type[BaseModel] | None = None,
     ) -> None:
-        for field_name, field_info in fields.items():
-            child = QTreeWidgetItem(
+        parent_path = self._item_path(parent)
+        children = [
+            QTreeWidgetItem(
                 [field_name if i == 0 else "" for i in range(0, self.value_col + 1)]
             )
+            for field_name in fields
+        ]
 
-            if parent is None:
-                self.addTopLevelItem(child)
-            else:
-                parent.addChild(child)
+        # Insert the whole level at once, item widgets need the items in the tree
+        if parent is None:
+            self.addTopLevelItems(children)
+        else:
+            parent.addChildren(children)
+
+        for child, (field_name, field_info) in zip(children, fields.items()):
+            self._path_index[parent_path + (field_name,)] = child
+            # Remember the model declaring the field for field-level checks
+            child.setData(0, Qt.ItemDataRole.UserRole, owner)
             if field_info.description:
                 child.setToolTip(0, field_info.description)
 
-            widget = BadgerResolvedType.resolve_qt(
-                annotation=field_info.annotation,
-                default=(
-                    field_info.default
-                    if defaults is None
-                    or field_name not in defaults
-                    or defaults[field_name] is None
-                    else defaults[field_name]
-                ),
-                editor_info=(self, child),
-            )
-            if widget is None:
-                resolved = BadgerResolvedType.resolve(field_info.annotation)
-                if resolved.main is None or not issubclass(resolved.main, BaseModel):
-                    raise ValueError(
-                        f"Could not resolve type for field {field_name} with annotation {field_info.annotation}"
-                    )
+            field_default = None if defaults is None else defaults.get(field_name)
+
+            # Nested models become subtrees, resolve_qt has no widget for them
+            resolved = BadgerResolvedType.resolve(field_info.annotation)
+            widget: QWidget | None = None
+            if _model_kind(resolved.main) == "model":
                 self._set_params_recurse(
                     child,
                     resolved.main.model_fields,
-                    (
-                        None
-                        if defaults is None
-                        or field_name not in defaults
-                        or defaults[field_name] is None
-                        else defaults[field_name]
-                    ),
+                    field_default,
                     hidden,
+                    resolved.main,
                 )
             else:
+                widget = BadgerResolvedType.resolve_qt_from(
+                    resolved,
+                    default=field_info.default
+                    if field_default is None
+                    else field_default,
+                    editor_info=(self, child),
+                )
+                if widget is None:
+                    raise ValueError(
+                        f"Could not resolve type for field {field_name} with annotation {field_info.annotation}"
+                    )
                 self.setItemWidget(child, self.value_col, widget)
 
             child.setDisabled(hidden)
@@ -709,10 +1106,13 @@ class BadgerPydanticEditor(QTreeWidget):
                 widget.addItem(selection.model_fields["name"].default, selection)
 
     def set_params_from_class(self, pydantic_class: type[Any]) -> None:
-        self.clear()
-        self.model_class = pydantic_class
-        self._set_params_recurse(None, self.model_class.model_fields, None, False)
-        self.set_params_post_setup({})
+        with self.populating():
+            self.clear()
+            self.model_class = pydantic_class
+            self._set_params_recurse(
+                None, self.model_class.model_fields, None, False, self.model_class
+            )
+            self.set_params_post_setup({})
         self.validate()
 
     def set_params_from_dict(self, params: dict[str, Any]) -> None:
@@ -727,9 +1127,11 @@ class BadgerPydanticEditor(QTreeWidget):
             type[BaseModel],
             create_model("DynamicModel", **field_definitions),  # type: ignore
         )
-        self._set_params_recurse(None, self.model_class.model_fields, params, False)
-
-        self.set_params_post_setup(params)
+        with self.populating():
+            self._set_params_recurse(
+                None, self.model_class.model_fields, params, False, self.model_class
+            )
+            self.set_params_post_setup(params)
         self.validate()
 
     def set_params_from_generator(
@@ -745,7 +1147,6 @@ class BadgerPydanticEditor(QTreeWidget):
         self.generator_name = generator_name
         self.defaults = defaults
 
-        self.clear()
         self.model_class = get_generator(generator_name)
 
         defaults["vocs"] = self.vocs.model_dump()
@@ -756,22 +1157,27 @@ class BadgerPydanticEditor(QTreeWidget):
             self.model_class, fields_to_remove, defaults, include_defaults=True
         )
 
-        self._set_params_recurse(
-            None,
-            filtered_class_fields,
-            defaults,
-            False,
-        )
+        with self.populating():
+            self.clear()
 
-        self._set_params_recurse(
-            None,
-            removed_class_fields,
-            defaults,
-            True,
-        )
+            self._set_params_recurse(
+                None,
+                filtered_class_fields,
+                defaults,
+                False,
+                self.model_class,
+            )
+
+            self._set_params_recurse(
+                None,
+                removed_class_fields,
+                defaults,
+                True,
+                self.model_class,
+            )
 
-        # Update parameters with defaults from generator class
-        self.set_params_post_setup(defaults)
+            # Update parameters with defaults from generator class
+            self.set_params_post_setup(defaults)
 
         if validate:
             self.validate()
@@ -795,16 +1201,14 @@ class BadgerPydanticEditor(QTreeWidget):
                     self.initialize_special_field(defaults, "algorithm")
 
     def initialize_special_field(self, defaults: dict[str, Any], field: str) -> None:
-        widget_items = self.findItems(field, Qt.MatchFlag.MatchExactly)
+        special_item = self.find_widget_at_path((field,))
 
-        if len(widget_items) == 0:
+        if special_item is None:
             logger.warning(
                 f"Generator has {field} set but no compatible {field} item exists in tree. Item has likely been filtered out from not being included in defaults when setting parameters."
             )
             return
 
-        special_item = widget_items[0]
-
         # Initialize combo box for special item
         widget = self.itemWidget(special_item, self.value_col)
         if widget is None or not isinstance(widget, QComboBox):
@@ -812,8 +1216,6 @@ class BadgerPydanticEditor(QTreeWidget):
 
         selections = self.get_all_compatible_classes(field)
 
-        self.initialize_combo_widget(widget, selections)
-
         special_item_dict: dict[str, Any] | None = defaults.get(field, {})
 
         if special_item_dict is None:
@@ -826,9 +1228,16 @@ class BadgerPydanticEditor(QTreeWidget):
 
         name = special_item_dict.get("name", "")
 
-        # Update combo box selection with name
-        if (index := widget.findText(name) if name else widget.findText("null")) >= 0:
-            widget.setCurrentIndex(index)
+        # Filling the combo box and picking the selection is part of the
+        # setup, so none of it should reach on_radio_changed or validation
+        with BlockSignalsContext(widget):
+            self.initialize_combo_widget(widget, selections)
+
+            # Update combo box selection with name
+            if (
+                index := widget.findText(name) if name else widget.findText("null")
+            ) >= 0:
+                widget.setCurrentIndex(index)
 
         self.update_params_from_generator_class(
             special_item,
@@ -847,38 +1256,15 @@ class BadgerPydanticEditor(QTreeWidget):
         if self.model_class is None:
             raise ValueError("Model class is not set.")
 
-        compatible_classes: Sequence[type[BaseModel] | None] = []
-
-        if field_name == "numerical_optimizer":
-            if not issubclass(self.model_class, BayesianGenerator):
-                raise ValueError("Generator does not support numerical optimizers.")
-            compatible_classes = self.model_class.get_compatible_numerical_optimizers()
-        elif field_name == "turbo_controller":
-            if not issubclass(self.model_class, BayesianGenerator):
-                raise ValueError("Generator does not support turbo controllers.")
-            compatible_classes = self.model_class.get_compatible_turbo_controllers()
-        elif field_name == "algorithm":
-            if not issubclass(self.model_class, BaxGenerator):
-                raise ValueError("Generator does not support algorithms.")
-            compatible_classes = self.model_class.get_compatible_algorithms()
-        else:
-            raise ValueError(f"Field name {field_name} is not recognized.")
-
-        return compatible_classes
+        return _compatible_classes(self.model_class, field_name)
 
     def get_compatible_class(self, name: str, field_name: str) -> type[BaseModel]:
-        compatible_classes = self.get_all_compatible_classes(field_name)
-
-        selected_class: type[BaseModel] | None = None
+        if self.model_class is None:
+            raise ValueError("Model class is not set.")
 
-        for opt in compatible_classes:
-            if opt is None:
-                if name == "null":
-                    break
-            else:
-                if opt.model_fields["name"].default == name:
-                    selected_class = opt
-                    break
+        selected_class = _compatible_classes_by_name(self.model_class, field_name).get(
+            name
+        )
 
         if selected_class is None:
             raise ValueError(
@@ -893,8 +1279,7 @@ class BadgerPydanticEditor(QTreeWidget):
         field_name: str,
     ) -> None:
         # Clear out existing children
-        for cc in tree_widget_item.takeChildren():
-            del cc
+        self._take_children(tree_widget_item)
 
         widget = self.itemWidget(tree_widget_item, self.value_col)
         if widget is None or not isinstance(widget, QComboBox):
@@ -906,13 +1291,14 @@ class BadgerPydanticEditor(QTreeWidget):
 
         # get values from current parameters
         parameters = self.get_parameters_yaml()
-        defaults = yaml.load(parameters, Loader=CustomSafeLoader)
-        self.update_params_from_generator_class(
-            tree_widget_item,
-            name,
-            field_name,
-            defaults,
-        )
+        defaults = _load_parameters(parameters)
+        with self.populating():
+            self.update_params_from_generator_class(
+                tree_widget_item,
+                name,
+                field_name,
+                defaults,
+            )
 
         self.validate()
 
@@ -942,12 +1328,14 @@ class BadgerPydanticEditor(QTreeWidget):
             filtered_class_fields,
             defaults,
             False,
+            pydantic_class,
         )
         self._set_params_recurse(
             tree_widget_item,
             removed_class_fields,
             defaults,
             True,
+            pydantic_class,
         )
 
         self.expandItem(tree_widget_item)
@@ -959,30 +1347,18 @@ class BadgerPydanticEditor(QTreeWidget):
         defaults: dict[str, Any] = {},
         include_defaults: bool = False,
     ) -> tuple[dict[str, FieldInfo], dict[str, FieldInfo]]:
-        condition: Callable[[str], bool]
-
-        def include_condition(k: str) -> bool:
-            return k in defaults and k not in fields_to_remove
-
-        def exclude_condition(k: str) -> bool:
-            return k not in fields_to_remove
-
-        if include_defaults:
-            condition = include_condition
-        else:
-            condition = exclude_condition
-
-        filtered_class_fields = {
-            k: v for k, v in pydantic_class.model_fields.items() if condition(k)
-        }
-
-        removed_class_fields = {
-            k: v
-            for k, v in pydantic_class.model_fields.items()
-            if k in fields_to_remove
-        }
+        return _split_class_fields(
+            pydantic_class,
+            tuple(fields_to_remove),
+            frozenset(defaults) if include_defaults else None,
+        )
 
-        return filtered_class_fields, removed_class_fields
+    @staticmethod
+    def get_default_model(pydantic_class: type[Any]) -> BaseModel:
+        # Defaults are trusted, so skip validation when building the model
+        return pydantic_class.model_construct(
+            **BadgerPydanticEditor.get_defaults_from_type(pydantic_class)
+        )
 
     @staticmethod
     def get_defaults_from_type(pydantic_class: type[Any]) -> dict[str, Any]:
@@ -1009,45 +1385,32 @@ class BadgerPydanticEditor(QTreeWidget):
     def find_widget_at_path(
         self, path: tuple[int | str, ...]
     ) -> QTreeWidgetItem | None:
-        if len(path) == 0:
-            return None
-
-        current_items: list[QTreeWidgetItem | None] = []
-        for i in range(self.topLevelItemCount()):
-            current_items.append(self.topLevelItem(i))
-
-        for level, target_name in enumerate(path):
-            found_item: QTreeWidgetItem | None = None
-            for item in current_items:
-                if item is None:
-                    continue
-                if item.text(0) == target_name:
-                    found_item = item
-                    break
-
-            if found_item is None:
-                return None
-
-            if level == len(path) - 1:
-                return found_item
-
-            current_items = []
-            for i in range(found_item.childCount()):
-                current_items.append(found_item.child(i))
+        # Error locations may contain list indices, which never name an item
+        return self._path_index.get(cast(tuple[str, ...], path))
 
-        return None
-
-    def remove_style(self, item: QTreeWidgetItem | None) -> None:
-        # Have to reset border styling in case some errors were fixed
-        if item is None:
-            return
+    def _remove_item_style(self, item: QTreeWidgetItem) -> None:
         item.setData(0, Qt.ItemDataRole.BackgroundRole, None)
         item.setToolTip(0, "")
         widget = self.itemWidget(item, self.value_col)
         if widget:
-            widget.setStyleSheet("")
-        for j in range(item.childCount()):
-            self.remove_style(item.child(j))
+            _set_error_state(widget, False)
+            if isinstance(widget, BadgerListEditor):
+                _set_error_state(widget.list_container, False)
+
+    def remove_error_styles(self) -> None:
+        # Only the items update_error_styles marked can carry error styling
+        for item in self._errored_items:
+            self._remove_item_style(item)
+        self._errored_items.clear()
+
+    def remove_style(self, item: QTreeWidgetItem | None) -> None:
+        # Have to reset border styling in case some errors were fixed.
+        # validate() only resets the errored items, this clears a subtree
+        stack = [item] if item is not None else []
+        while stack:
+            current = stack.pop()
+            self._remove_item_style(current)
+            stack.extend(current.child(j) for j in range(current.childCount()))
 
     def update_vocs(self, vocs: VOCS) -> None:
         logger.debug(f"Updating VOCS in BadgerPydanticEditor: {vocs}")
@@ -1056,7 +1419,7 @@ class BadgerPydanticEditor(QTreeWidget):
         parameters = self.get_parameters_yaml()
         logger.debug(f"Extracted parameters from tree: {parameters}")
 
-        defaults = yaml.load(parameters, Loader=CustomSafeLoader)
+        defaults = _load_parameters(parameters)
 
         self.set_params_from_generator(self.generator_name, defaults, self.vocs)
         self.validate()
@@ -1066,30 +1429,33 @@ class BadgerPydanticEditor(QTreeWidget):
         if model_class is None:
             return
 
-        self.clear()
-
         fields_to_remove = ["vocs"]
 
         filtered_class_fields, removed_class_fields = self.filter_class_fields(
             model_class, fields_to_remove, defaults, include_defaults=True
         )
 
-        self._set_params_recurse(
-            None,
-            filtered_class_fields,
-            defaults,
-            False,
-        )
+        with self.populating():
+            self.clear()
 
-        self._set_params_recurse(
-            None,
-            removed_class_fields,
-            defaults,
-            True,
-        )
+            self._set_params_recurse(
+                None,
+                filtered_class_fields,
+                defaults,
+                False,
+                self.model_class,
+            )
 
-        # Update parameters with defaults from generator class
-        self.set_params_post_setup(defaults)
+            self._set_params_recurse(
+                None,
+                removed_class_fields,
+                defaults,
+                True,
+                self.model_class,
+            )
+
+            # Update parameters with defaults from generator class
+            self.set_params_post_setup(defaults)
 
         if self.update_callback is not None:
             self.update_callback(self)
@@ -1133,17 +1499,34 @@ class BadgerPydanticEditor(QTreeWidget):
                     continue
                 self._inject_computed_fields(sub, sub_class)
 
-    def validate(self) -> None:
+    def validate(self, interactive: bool = False) -> None:
+        """
+        Validate the tree against the model class and refresh it.
+
+        With interactive set, models that support it are only checked by hand
+        (see _supports_interactive_validation) and the tree is left as is; the
+        full model_validate then runs once focus leaves the editor.
+        """
         if self.model_class is None:
             raise ValueError("Model class is not set.")
 
-        self.setStyleSheet("")
-        for i in range(self.topLevelItemCount()):
-            self.remove_style(self.topLevelItem(i))
+        if not interactive:
+            # A full validation covers any edits still waiting for the timer
+            self._validate_timer.stop()
+            self._pending_items.clear()
+
+        parameters = self.get_parameters_yaml()
+        if parameters == self._last_validated_parameters:
+            # Nothing changed since the last full validation, so the tree and
+            # its error styles are still current
+            self._validation_pending = False
+            return
+
+        _set_error_state(self, False)
+        self.remove_error_styles()
 
         try:
-            parameters = self.get_parameters_yaml()
-            parameters_dict = yaml.load(parameters, Loader=CustomSafeLoader)
+            parameters_dict = _load_parameters(parameters)
 
             def convert_dict(val: Any) -> Any:
                 # Convert str-encoded dicts (and lists) back into actual dict objects."""
@@ -1173,6 +1556,18 @@ class BadgerPydanticEditor(QTreeWidget):
                 raise KeyError("vocs field is required in parameters")
 
             self._inject_computed_fields(parameters_dict, self.model_class)
+
+            if (
+                interactive
+                and self.interactive_validation
+                and _supports_interactive_validation(self.model_class)
+            ):
+                for loc, msg in _check_scalar_fields(self.model_class, parameters_dict):
+                    self.update_error_styles(loc, msg)
+                self._validation_pending = True
+                return
+
+            self._validation_pending = False
             model = self.model_class.model_validate(parameters_dict)
 
             # After we validate the model, some fields may have been changed due to any validation logic present within the Pydantic model (i.e. field validators changing default values). We need to update the tree to reflect these changes.
@@ -1184,21 +1579,85 @@ class BadgerPydanticEditor(QTreeWidget):
 
             self.update_after_validate(defaults)
 
+        # The errors are shown on the tree items, so they are only logged at
+        # debug level. Logging formats them lazily, and str() of a
+        # ValidationError walks every error in it.
         except KeyError as e:
-            logger.error(e)
+            logger.debug(e)
         except VOCSError as e:
-            logger.error(e)
+            logger.debug(e)
             loc: tuple[int | str, ...] = ("vocs",)
             msg = e.message if hasattr(e, "message") else str(e)
             self.update_error_styles(loc, msg)
         except ValidationError as e:
-            logger.error(e)
+            logger.debug(e)
 
             for error in e.errors():
                 loc = error["loc"]
                 msg = error["msg"]
                 self.update_error_styles(loc, msg)
 
+        self._last_validated_parameters = parameters
+
+    def schedule_validate_item(self, item: QTreeWidgetItem) -> None:
+        """
+        Queue an edited item for validate_item.
+
+        Dragging a spin box or typing emits a change per step, so the items
+        are collected and checked once the edits pause for
+        validation_delay_ms.
+        """
+        if item not in self._pending_items:
+            self._pending_items.append(item)
+        self._validation_pending = True
+        self._validate_timer.start()
+
+    def _validate_pending_items(self) -> None:
+        items, self._pending_items = self._pending_items, []
+        for item in items:
+            # Items can be taken out of the tree while they wait
+            if item.treeWidget() is self:
+                self.validate_item(item)
+
+    def validate_item(self, item: QTreeWidgetItem) -> None:
+        """
+        Check an edited field on its own while the user is typing.
+
+        Fields without validators of their own are checked with a TypeAdapter
+        for their annotation, and the full validate() runs once focus leaves
+        the editor. Anything else goes through validate() right away.
+        """
+        owner = item.data(0, Qt.ItemDataRole.UserRole)
+        widget = self.itemWidget(item, self.value_col)
+        adapter = (
+            _field_adapter(owner, item.text(0))
+            if owner is not None and self.interactive_validation
+            else None
+        )
+        # validate() only gets to model_validate for models with vocs
+        if (
+            adapter is None
+            or widget is None
+            or self.model_class is None
+            or "vocs" not in self.model_class.model_fields
+        ):
+            self.validate(interactive=True)
+            return
+
+        if item in self._errored_items:
+            self._remove_item_style(item)
+            self._errored_items.remove(item)
+        self._validation_pending = True
+        try:
+            adapter.validate_python(
+                _load_parameters(_qt_widget_to_yaml_value(widget) or "null")
+            )
+        except ValidationError as e:
+            logger.debug(e)
+            path = self._item_path(item)
+            for error in e.errors():
+                self.update_error_styles(path, error["msg"])
+
     def update_error_styles(self, loc: tuple[int | str, ...], msg: str) -> None:
         error_widget: QTreeWidgetItem | QTreeWidget | "BadgerPydanticEditor" | None = (
             None
@@ -1209,20 +1668,16 @@ class BadgerPydanticEditor(QTreeWidget):
             error_widget = self
         if error_widget:
             if type(error_widget) is QTreeWidgetItem:
+                self._errored_items.append(error_widget)
                 error_widget.setBackground(0, Qt.GlobalColor.red)
                 widget = self.itemWidget(error_widget, self.value_col)
                 if widget is not None:
-                    widget.setProperty("error", True)
-                    widget.setStyleSheet('*[error="true"] { border: 2px dashed red }')
+                    _set_error_state(widget, True)
                     if isinstance(widget, BadgerListEditor):
-                        widget.list_container.setProperty("error", True)
-                        widget.list_container.setStyleSheet(
-                            '*[error="true"] { border: 2px dashed red }'
-                        )
+                        _set_error_state(widget.list_container, True)
 
                 error_widget.setToolTip(0, msg)
             else:
                 error_widget = cast(QTreeWidget, error_widget)
-                error_widget.setProperty("error", True)
-                error_widget.setStyleSheet('*[error="true"] { border: 2px dashed red }')
+                _set_error_state(error_widget, True)
                 error_widget.setToolTip(msg)
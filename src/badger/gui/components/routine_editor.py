@@ -39,11 +39,11 @@ class BadgerRoutineEditor(QWidget):
         routine_edit.setReadOnly(True)
         stacks.addWidget(routine_edit)
 
+        # The routine page is built on first use, see routine_page
         self.scroll_area = scroll_area = QScrollArea()
-        self.routine_page = routine_page = BadgerRoutinePage()
         scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(routine_page)
         stacks.addWidget(scroll_area)
+        self._routine_page = None
 
         stacks.setCurrentIndex(1)
         vbox.addWidget(stacks)
@@ -76,6 +76,27 @@ class BadgerRoutineEditor(QWidget):
         self.btn_cancel.clicked.connect(self.cancel_create_routine)
         self.btn_save.clicked.connect(self.save_routine)
 
+    @property
+    def routine_page(self) -> BadgerRoutinePage:
+        """
+        The routine page, constructed the first time it is needed so that
+        opening the editor on the read-only YAML view stays cheap.
+        """
+        return self._ensure_routine_page()
+
+    def _ensure_routine_page(self) -> BadgerRoutinePage:
+        if self._routine_page is None:
+            self._routine_page = BadgerRoutinePage()
+            self.scroll_area.setWidget(self._routine_page)
+        return self._routine_page
+
+    def showEvent(self, event):
+        # The page stack is shown by default, so it needs to be there
+        # whenever the stack is
+        if self.stacks.currentIndex() == 1:
+            self._ensure_routine_page()
+        super().showEvent(event)
+
     def set_routine(self, routine: Routine, silent=False):
         try:
             self.routine_edit.setText(routine.yaml())
@@ -84,6 +105,7 @@ class BadgerRoutineEditor(QWidget):
         self.routine_page.refresh_ui(routine, silent=silent)
 
     def edit_routine(self):
+        self._ensure_routine_page()
         self.stacks.setCurrentIndex(1)
 
     def cancel_create_routine(self):
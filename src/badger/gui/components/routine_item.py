@@ -2,9 +2,10 @@
 and environment with hover/selection styling and a delete button."""
 
 from datetime import datetime
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel
-from PyQt5.QtWidgets import QSizePolicy, QMessageBox
-from PyQt5.QtCore import Qt, pyqtSignal
+from functools import lru_cache
+from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel
+from PyQt5.QtWidgets import QSizePolicy, QMessageBox, QToolTip
+from PyQt5.QtCore import Qt, QEvent, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont
 from badger.gui.components.eliding_label import ElidingLabel
 from badger.gui.utils import create_button
@@ -62,11 +63,64 @@ QPushButton
 }
 """
 
+# badger_state of an item, indexed by [activated][hover]
+ITEM_STATES = (("normal", "normal_hover"), ("activate", "activate_hover"))
+
+
+@lru_cache(maxsize=None)
+def _cool_font() -> QFont:
+    # Built on first use rather than at import, since a QFont needs the
+    # application's font database; QFont is implicitly shared, so every
+    # routine name label refers to the same font data
+    cool_font = QFont()
+    cool_font.setWeight(QFont.DemiBold)
+    cool_font.setPixelSize(16)
+    return cool_font
+
+
+@lru_cache(maxsize=None)
+def _build_stylesheets(
+    normal: str, normal_hover: str, activate: str, activate_hover: str
+) -> tuple[str, str, str, str]:
+    # Items of the same environment share their stylesheet strings
+    return tuple(
+        f"""
+    background-color: {color};
+    border-radius: 2px;
+"""
+        for color in (normal, normal_hover, activate, activate_hover)
+    )
+
+
+@lru_cache(maxsize=None)
+def _item_stylesheet(
+    normal: str, normal_hover: str, activate: str, activate_hover: str
+) -> str:
+    # One sheet holding all the states, selected by the badger_state
+    # property, so switching states only needs a repolish
+    return "\n".join(
+        f'BadgerRoutineItem[badger_state="{state}"] {{{sheet}}}'
+        for state, sheet in (
+            ("normal", normal),
+            ("normal_hover", normal_hover),
+            ("activate", activate),
+            ("activate_hover", activate_hover),
+        )
+    )
+
+
+@lru_cache(maxsize=1024)
+def _format_timestamp(timestamp: str) -> str:
+    return datetime.fromisoformat(timestamp).strftime("%m/%d/%Y, %H:%M:%S")
+
 
 class BadgerRoutineItem(QWidget):
     # sig_del carries an id
     sig_del = pyqtSignal(str)
 
+    # Hover changes within this window are applied together
+    hover_delay_ms: int = 16
+
     def __init__(
         self, id, name, timestamp, environment, env_dict, description="", parent=None
     ):
@@ -77,137 +131,146 @@ class BadgerRoutineItem(QWidget):
         self.id = id
         self.name = name
         self.timestamp = timestamp
+        self.time_str = _format_timestamp(timestamp)
         self.description = description
         if environment in env_dict:
             self.color_dict = env_dict[environment]
-            self.stylesheet_normal = f"""
-                background-color: {self.color_dict["normal"]};
-                border-radius: 2px;
-            """
-            self.stylesheet_normal_hover = f"""
-                background-color: {self.color_dict["normal_hover"]};
-                border-radius: 2px;
-            """
-            self.stylesheet_activate = f"""
-                background-color: {self.color_dict["activate"]};
-                border-radius: 2px;
-            """
-            self.stylesheet_activate_hover = f"""
-                background-color: {self.color_dict["activate_hover"]};
-                border-radius: 2px;
-            """
+            (
+                self.stylesheet_normal,
+                self.stylesheet_normal_hover,
+                self.stylesheet_activate,
+                self.stylesheet_activate_hover,
+            ) = _build_stylesheets(
+                self.color_dict["normal"],
+                self.color_dict["normal_hover"],
+                self.color_dict["activate"],
+                self.color_dict["activate_hover"],
+            )
         else:
             self.stylesheet_normal = stylesheet_normal_default
             self.stylesheet_normal_hover = stylesheet_normal_hover_default
             self.stylesheet_activate = stylesheet_activate_default
             self.stylesheet_activate_hover = stylesheet_activate_hover_default
 
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(self.hover_delay_ms)
+        self._hover_timer.timeout.connect(self._apply_state)
+
         self.init_ui()
         self.config_logic()
 
     def init_ui(self):
         self.setAttribute(Qt.WA_StyledBackground)
-        self.setStyleSheet(self.stylesheet_normal)
-
-        cool_font = QFont()
-        cool_font.setWeight(QFont.DemiBold)
-        cool_font.setPixelSize(16)
-
-        hbox = QHBoxLayout(self)
-        hbox.setContentsMargins(0, 0, 0, 0)
-        hbox.setSpacing(0)
-        info_panel = QWidget()
-        hbox.addWidget(info_panel, 1)
-        vbox = QVBoxLayout(info_panel)
-        vbox.setContentsMargins(8, 8, 8, 8)
-        vbox.setSpacing(0)
-        name_panel = QWidget()
-        hbox_name = QHBoxLayout(name_panel)
-        hbox_name.setContentsMargins(4, 0, 0, 0)
+        self.setProperty("badger_state", "normal")
+        self.setStyleSheet(
+            _item_stylesheet(
+                self.stylesheet_normal,
+                self.stylesheet_normal_hover,
+                self.stylesheet_activate,
+                self.stylesheet_activate_hover,
+            )
+        )
+
+        # Single grid instead of nested panels, the empty outer rows and
+        # columns hold the padding around the labels:
+        #   col 0 and 1: left padding (the name sits 4px further in)
+        #   col 3: gap before the delete button, which spans all rows
+        #   row 0 and 3: top and bottom padding
+        grid = QGridLayout(self)
+        grid.setContentsMargins(0, 0, 0, 0)
+        grid.setSpacing(0)
+        grid.setColumnMinimumWidth(0, 8)
+        grid.setColumnMinimumWidth(1, 4)
+        grid.setColumnMinimumWidth(3, 8)
+        grid.setColumnStretch(2, 1)
+        grid.setRowMinimumHeight(0, 8)
+        grid.setRowMinimumHeight(3, 8)
+
         routine_name = ElidingLabel(self.name)
         routine_name.setMinimumWidth(180)
-        routine_name.setFont(cool_font)
-        hbox_name.addWidget(routine_name)
-        vbox.addWidget(name_panel)
-        _timestamp = datetime.fromisoformat(self.timestamp)
-        time_str = _timestamp.strftime("%m/%d/%Y, %H:%M:%S")
-        time_created = QLabel(time_str)
-        vbox.addWidget(time_created)
+        routine_name.setFont(_cool_font())
+        grid.addWidget(routine_name, 1, 2)
+        time_created = QLabel(self.time_str)
+        grid.addWidget(time_created, 2, 1, 1, 2)
 
         # Routine tools
-        self.btn_fav = btn_fav = create_button(
-            "star.png", "Favorite routine", stylesheet_fav, size=None
-        )
-        btn_fav.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        btn_fav.setFixedWidth(32)
-        btn_fav.hide()  # hide it for now
+        # The favorite button is hidden for now, so it is not built
+        self.btn_fav = None
         self.btn_del = btn_del = create_button(
             "trash.png", "Delete routine", stylesheet_del, size=None
         )
         btn_del.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
         btn_del.setFixedWidth(32)
         # btn_del.hide()
-        hbox.addWidget(btn_fav)
-        hbox.addWidget(btn_del)
-
-        self.update_tooltip()
+        grid.addWidget(btn_del, 0, 4, 4, 1)
 
     def config_logic(self):
         self.btn_del.clicked.connect(self.delete_routine)
         # self.btn_fav.clicked.connect(self.favorite_routine)
 
+    def set_state(self, state: str) -> None:
+        # Hover events can repeat the current state, which needs no repolish
+        if self.property("badger_state") == state:
+            return
+        self.setProperty("badger_state", state)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+
+    def _apply_state(self) -> None:
+        self.set_state(ITEM_STATES[self.activated][self.hover])
+
     def activate(self):
         self.activated = True
-        if self.hover:
-            self.setStyleSheet(self.stylesheet_activate_hover)
-        else:
-            self.setStyleSheet(self.stylesheet_activate)
+        self._apply_state()
 
     def deactivate(self):
         self.activated = False
-        if self.hover:
-            self.setStyleSheet(self.stylesheet_normal_hover)
-        else:
-            self.setStyleSheet(self.stylesheet_normal)
+        self._apply_state()
 
     def enterEvent(self, event):
         self.hover = True
         # self.btn_fav.show()
         # self.btn_del.show()
-        if self.activated:
-            self.setStyleSheet(self.stylesheet_activate_hover)
-        else:
-            self.setStyleSheet(self.stylesheet_normal_hover)
+        self._hover_timer.start()
 
     def leaveEvent(self, event):
         self.hover = False
         # self.btn_fav.hide()
         # self.btn_del.hide()
-        if self.activated:
-            self.setStyleSheet(self.stylesheet_activate)
-        else:
-            self.setStyleSheet(self.stylesheet_normal)
+        self._hover_timer.start()
 
     def delete_routine(self):
-        reply = QMessageBox.question(
-            self.parent(),
+        # Opened window-modal rather than exec'd, so no nested event loop
+        # runs while the question is up
+        reply = QMessageBox(
+            QMessageBox.Question,
             "Delete routine",
             f"Are you sure you want to delete routine {self.name}?",
             QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
+            self,
         )
-        if reply != QMessageBox.Yes:
+        reply.setDefaultButton(QMessageBox.No)
+        reply.setAttribute(Qt.WA_DeleteOnClose)
+        reply.finished.connect(self.on_delete_reply)
+        reply.open()
+
+    def on_delete_reply(self, result: int):
+        if result != QMessageBox.Yes:
             return
 
         self.sig_del.emit(self.id)
 
-    def update_tooltip(self):
-        _timestamp = datetime.fromisoformat(self.timestamp)
-        time_str = _timestamp.strftime("%m/%d/%Y, %H:%M:%S")
-        self.setToolTip(
-            f"name: {self.name}\ncreated at: {time_str}\ndescription:\n{self.description}"
-        )
+    def tooltip_text(self) -> str:
+        return f"name: {self.name}\ncreated at: {self.time_str}\ndescription:\n{self.description}"
+
+    def event(self, event):
+        # The tooltip is only built when Qt asks for it
+        if event.type() == QEvent.ToolTip:
+            QToolTip.showText(event.globalPos(), self.tooltip_text(), self)
+            return True
+        return super().event(event)
 
     def update_description(self, descr):
         self.description = descr
-        self.update_tooltip()
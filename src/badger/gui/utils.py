@@ -2,6 +2,7 @@
 scroll-wheel filters for spinboxes, custom combo boxes, and dialog
 utilities."""
 
+from functools import lru_cache
 from importlib import resources
 from typing import Any
 from PyQt5.QtWidgets import QAbstractSpinBox, QPushButton, QComboBox, QToolButton
@@ -28,6 +29,15 @@ class MouseWheelWidgetAdjustmentGuard(QObject):
         return super().eventFilter(o, e)
 
 
+@lru_cache(maxsize=None)
+def _load_icon(icon_file: str) -> QIcon:
+    # QIcon is implicitly shared, buttons using the same image reuse one
+    # icon and its decoded pixmaps
+    icon_ref = resources.files(__package__) / f"./images/{icon_file}"
+    with resources.as_file(icon_ref) as icon_path:
+        return QIcon(str(icon_path))
+
+
 def create_button(
     icon_file,
     tooltip,
@@ -36,9 +46,7 @@ def create_button(
     icon_size=None,
     tool_button=False,
 ):
-    icon_ref = resources.files(__package__) / f"./images/{icon_file}"
-    with resources.as_file(icon_ref) as icon_path:
-        icon = QIcon(str(icon_path))
+    icon = _load_icon(icon_file)
 
     if tool_button:
         btn = QToolButton()
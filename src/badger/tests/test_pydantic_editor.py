@@ -0,0 +1,716 @@
+import json
+
+from pytestqt.qtbot import QtBot
+
+
+def test_parameters_are_json(qtbot: QtBot):
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    params = {
+        "count": 3,
+        "scale": 2.5,
+        "label": 'say "hi" \\ bye',
+        "enabled": True,
+        "nothing": None,
+    }
+    editor.set_params_from_dict(params)
+
+    assert json.loads(editor.get_parameters_yaml()) == params
+
+
+def test_dict_editor_keys_are_strings(qtbot: QtBot):
+    from badger.gui.components.pydantic_editor import BadgerListEditor
+
+    editor = BadgerListEditor(int, float)
+    qtbot.addWidget(editor)
+
+    row = editor.add_widget()
+    row.parameter1().setValue(7)
+    row.parameter2().setValue(0.5)
+
+    assert json.loads(editor.get_parameters_yaml()) == {"7": 0.5}
+
+
+def test_dict_editor_tuple_keys(qtbot: QtBot):
+    from badger.gui.components.pydantic_editor import (
+        BadgerListEditor,
+        _load_parameters,
+    )
+
+    editor = BadgerListEditor(str, float)
+    qtbot.addWidget(editor)
+
+    row = editor.add_widget()
+    row.parameter1().setText("(1, 2)")
+    row.parameter2().setValue(0.5)
+
+    assert _load_parameters(editor.get_parameters_yaml()) == {(1, 2): 0.5}
+
+
+def test_dict_editor_skips_null_keys(qtbot: QtBot):
+    from badger.gui.components.pydantic_editor import BadgerListEditor
+
+    editor = BadgerListEditor(str, float)
+    qtbot.addWidget(editor)
+
+    row = editor.add_widget()
+    row.parameter1().setText("null")
+    row.parameter2().setValue(0.5)
+    row = editor.add_widget()
+    row.parameter1().setText("a")
+    row.parameter2().setValue(1.5)
+
+    # JSON has no null keys, so rows without a key are left out
+    assert json.loads(editor.get_parameters_yaml()) == {"a": 1.5}
+
+
+def test_load_parameters_tuple_strings():
+    from badger.gui.components.pydantic_editor import _load_parameters
+
+    params = _load_parameters(
+        '{"bounds": "(0.0, 1.0)", "pairs": ["(1, 2)", "x"], "text": "(not a tuple)"}'
+    )
+
+    assert params == {
+        "bounds": (0.0, 1.0),
+        "pairs": [(1, 2), "x"],
+        "text": "(not a tuple)",
+    }
+
+
+def test_field_names_are_escaped(qtbot: QtBot):
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    params = {'odd "name" \\': 1}
+    editor.set_params_from_dict(params)
+
+    assert json.loads(editor.get_parameters_yaml()) == params
+
+
+def test_non_finite_spin_box_values(qtbot: QtBot):
+    from PyQt5.QtWidgets import QDoubleSpinBox
+
+    from badger.gui.components.pydantic_editor import (
+        _load_parameters,
+        _qt_widget_to_yaml_value,
+    )
+
+    spin_box = QDoubleSpinBox()
+    qtbot.addWidget(spin_box)
+    spin_box.setRange(float("-inf"), float("inf"))
+
+    spin_box.setValue(float("inf"))
+    assert _load_parameters(_qt_widget_to_yaml_value(spin_box)) == float("inf")
+
+    spin_box.setValue(float("-inf"))
+    assert _load_parameters(_qt_widget_to_yaml_value(spin_box)) == float("-inf")
+
+
+def test_validate_generator(qtbot: QtBot):
+    from PyQt5.QtCore import Qt
+    from xopt.generators import get_generator_defaults
+    from xopt.vocs import VOCS
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+    from badger.gui.utils import filter_generator_config
+
+    vocs = VOCS(variables={"x0": [0, 1]}, objectives={"f": "MINIMIZE"})
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    name = "upper_confidence_bound"
+    defaults = filter_generator_config(name, get_generator_defaults(name))
+    editor.set_params_from_generator(name, defaults, vocs)
+
+    item = editor.findItems("beta", Qt.MatchFlag.MatchExactly)[0]
+    editor.itemWidget(item, 1).setValue(3.5)
+    editor.validate()
+
+    params = editor.get_parameters_dict()
+    assert params["beta"] == 3.5
+    assert not editor.property("badger_error")
+
+
+def test_get_default_model():
+    from pydantic import BaseModel, Field
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    class Model(BaseModel):
+        beta: float = Field(2.0, ge=0)
+        names: list[str] = Field(default_factory=lambda: ["a"])
+        required: int
+
+    model = BadgerPydanticEditor.get_default_model(Model)
+
+    assert model.beta == 2.0
+    assert model.names == ["a"]
+    assert not hasattr(model, "required")
+
+
+def test_interactive_validation_support():
+    from typing import Optional
+
+    from pydantic import BaseModel, Field, field_validator
+    from xopt.generators import get_generator
+
+    from badger.gui.components.pydantic_editor import (
+        _check_scalar_fields,
+        _supports_interactive_validation,
+    )
+
+    class Model(BaseModel):
+        beta: float = Field(2.0, ge=0, lt=10)
+        label: str = ""
+        count: Optional[int] = None
+
+    class ValidatedModel(Model):
+        @field_validator("beta")
+        @classmethod
+        def check_beta(cls, value: float) -> float:
+            return value
+
+    assert _supports_interactive_validation(Model)
+    assert not _supports_interactive_validation(ValidatedModel)
+    assert not _supports_interactive_validation(get_generator("upper_confidence_bound"))
+
+    assert _check_scalar_fields(Model, {"beta": 1.0, "label": "a", "count": None}) == []
+    assert _check_scalar_fields(Model, {"beta": -1.0, "label": None}) == [
+        (("beta",), "Input should be greater than or equal to 0"),
+        (("label",), "Input should be a valid str"),
+    ]
+    assert _check_scalar_fields(Model, {"beta": 10.0}) == [
+        (("beta",), "Input should be less than 10"),
+    ]
+
+
+def test_interactive_validate_generator(qtbot: QtBot):
+    from PyQt5.QtCore import Qt
+    from xopt.generators import get_generator_defaults
+    from xopt.vocs import VOCS
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+    from badger.gui.utils import filter_generator_config
+
+    vocs = VOCS(variables={"x0": [0, 1]}, objectives={"f": "MINIMIZE"})
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    name = "upper_confidence_bound"
+    defaults = filter_generator_config(name, get_generator_defaults(name))
+    editor.set_params_from_generator(name, defaults, vocs)
+
+    # beta has no validator of its own, so only the field is checked and
+    # model_validate waits for focus to leave the editor
+    item = editor.findItems("beta", Qt.MatchFlag.MatchExactly)[0]
+    editor.itemWidget(item, 1).setValue(4.5)
+    assert editor._validation_pending
+    assert editor.get_parameters_dict()["beta"] == 4.5
+
+    editor.validate()
+    assert not editor._validation_pending
+    assert editor.get_parameters_dict()["beta"] == 4.5
+
+
+def test_compatible_classes(qtbot: QtBot):
+    import pytest
+    from xopt.generators import get_generator
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+    editor.model_class = get_generator("upper_confidence_bound")
+
+    classes = editor.get_all_compatible_classes("turbo_controller")
+    assert classes is editor.get_all_compatible_classes("turbo_controller")
+
+    for cls in classes:
+        if cls is not None:
+            name = cls.model_fields["name"].default
+            assert editor.get_compatible_class(name, "turbo_controller") is cls
+
+    with pytest.raises(ValueError):
+        editor.get_compatible_class("null", "turbo_controller")
+    with pytest.raises(ValueError):
+        editor.get_all_compatible_classes("not_a_field")
+
+
+def test_find_widget_at_path(qtbot: QtBot):
+    from PyQt5.QtCore import Qt
+    from xopt.generators import get_generator_defaults
+    from xopt.vocs import VOCS
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    vocs = VOCS(variables={"x0": [0, 1]}, objectives={"f": "MINIMIZE"})
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    name = "upper_confidence_bound"
+    editor.set_params_from_generator(name, get_generator_defaults(name), vocs)
+
+    beta = editor.findItems("beta", Qt.MatchFlag.MatchExactly)[0]
+    assert editor.find_widget_at_path(("beta",)) is beta
+    assert editor.find_widget_at_path(()) is None
+    assert editor.find_widget_at_path(("beta", 0)) is None
+
+    optimizer = editor.find_widget_at_path(("numerical_optimizer",))
+    child = optimizer.child(0)
+    assert editor.find_widget_at_path(("numerical_optimizer", child.text(0))) is child
+
+    # Children are rebuilt when another optimizer is picked
+    combo = editor.itemWidget(optimizer, 1)
+    combo.setCurrentIndex((combo.currentIndex() + 1) % combo.count())
+    optimizer = editor.find_widget_at_path(("numerical_optimizer",))
+    for i in range(optimizer.childCount()):
+        child = optimizer.child(i)
+        assert (
+            editor.find_widget_at_path(("numerical_optimizer", child.text(0))) is child
+        )
+
+
+def test_populating_restores_tree(qtbot: QtBot):
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    with editor.populating():
+        with editor.populating():
+            assert not editor.updatesEnabled()
+            assert editor.signalsBlocked()
+        assert not editor.updatesEnabled()
+
+    assert editor.updatesEnabled()
+    assert not editor.signalsBlocked()
+
+    editor.set_params_from_dict({"a": 1})
+    assert editor.updatesEnabled()
+    assert not editor.signalsBlocked()
+
+
+def test_list_editor_remove(qtbot: QtBot):
+    from badger.gui.components.pydantic_editor import BadgerListEditor
+
+    editor = BadgerListEditor(int)
+    qtbot.addWidget(editor)
+
+    rows = [editor.add_widget() for _ in range(3)]
+    for i, row in enumerate(rows):
+        row.parameter1().setValue(i)
+
+    rows[1].remove()
+
+    # The row is gone right away, not once the deferred delete runs
+    assert editor.list_items() == [rows[0], rows[2]]
+    assert json.loads(editor.get_parameters_yaml()) == [0, 2]
+    assert editor.get_parameters_dict() == [0, 2]
+
+
+def test_field_adapter():
+    from typing import Optional
+
+    import pytest
+    from pydantic import BaseModel, Field, ValidationError, field_validator
+
+    from badger.gui.components.pydantic_editor import _field_adapter
+
+    class Model(BaseModel):
+        beta: Optional[float] = Field(None, ge=0)
+        checked: int = 0
+
+        @field_validator("checked")
+        @classmethod
+        def check(cls, value: int) -> int:
+            return value
+
+    adapter = _field_adapter(Model, "beta")
+    assert adapter is not None
+    assert adapter.validate_python(None) is None
+    assert adapter.validate_python(1) == 1.0
+    with pytest.raises(ValidationError):
+        adapter.validate_python(-1)
+
+    assert _field_adapter(Model, "checked") is None
+    assert _field_adapter(Model, "missing") is None
+
+
+def test_nested_parameters_other_value_column(qtbot: QtBot):
+    from pydantic import BaseModel
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    class Inner(BaseModel):
+        scale: float = 2.5
+
+    class Outer(BaseModel):
+        inner: Inner = Inner()
+        count: int = 3
+
+    editor = BadgerPydanticEditor(value_col=2)
+    qtbot.addWidget(editor)
+    editor.set_params_from_class(Outer)
+
+    expected = {"inner": {"scale": 2.5}, "count": 3}
+    assert json.loads(editor.get_parameters_yaml()) == expected
+    assert editor.get_parameters_dict() == expected
+
+
+def test_error_styles_are_reset(qtbot: QtBot):
+    from PyQt5.QtCore import Qt
+    from xopt.generators import get_generator_defaults
+    from xopt.vocs import VOCS
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    vocs = VOCS(variables={"x0": [0, 1]}, objectives={"f": "MINIMIZE"})
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    name = "upper_confidence_bound"
+    editor.set_params_from_generator(name, get_generator_defaults(name), vocs)
+
+    item = editor.find_widget_at_path(("beta",))
+    editor.update_error_styles(("beta",), "bad beta")
+    assert item.toolTip(0) == "bad beta"
+    assert editor.itemWidget(item, 1).property("badger_error")
+
+    editor.remove_error_styles()
+    assert item.toolTip(0) == ""
+    assert item.data(0, Qt.ItemDataRole.BackgroundRole) is None
+    assert not editor.itemWidget(item, 1).property("badger_error")
+    # The rule is installed once on the editor, not on each widget
+    assert editor.itemWidget(item, 1).styleSheet() == ""
+    assert "badger_error" in editor.styleSheet()
+
+    # remove_style clears a whole subtree
+    nested = editor.find_widget_at_path(("numerical_optimizer", "max_iter"))
+    editor.update_error_styles(("numerical_optimizer", "max_iter"), "bad")
+    editor.remove_style(editor.find_widget_at_path(("numerical_optimizer",)))
+    assert nested.toolTip(0) == ""
+    assert not editor.itemWidget(nested, 1).property("badger_error")
+
+
+def test_validate_skips_unchanged_parameters(qtbot: QtBot, mocker):
+    from xopt.generators import get_generator_defaults
+    from xopt.vocs import VOCS
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    vocs = VOCS(variables={"x0": [0, 1]}, objectives={"f": "MINIMIZE"})
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    name = "upper_confidence_bound"
+    editor.set_params_from_generator(name, get_generator_defaults(name), vocs)
+    editor.validate()
+
+    rebuild = mocker.spy(editor, "update_after_validate")
+    editor.validate()
+    rebuild.assert_not_called()
+
+    item = editor.find_widget_at_path(("beta",))
+    editor.itemWidget(item, 1).setValue(5.5)
+    editor.validate()
+    rebuild.assert_called_once()
+
+
+def test_widget_handlers_cover_subclasses(qtbot: QtBot):
+    from PyQt5.QtWidgets import QDoubleSpinBox
+
+    from badger.gui.components.pydantic_editor import (
+        _qt_widget_to_value,
+        _qt_widget_to_yaml_value,
+        _set_value_for_basic_widget,
+    )
+
+    class SpinBox(QDoubleSpinBox):
+        pass
+
+    spin_box = SpinBox()
+    qtbot.addWidget(spin_box)
+
+    _set_value_for_basic_widget(spin_box, "1.5")
+    assert _qt_widget_to_yaml_value(spin_box) == "1.5"
+    assert _qt_widget_to_value(spin_box) == 1.5
+
+    # Widgets without a handler serialize as null
+    assert _qt_widget_to_yaml_value(object()) == "null"
+    assert _qt_widget_to_value(object()) is None
+
+
+def test_list_editor_signals(qtbot: QtBot):
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QPushButton
+
+    from badger.gui.components.pydantic_editor import BadgerListEditor
+
+    editor = BadgerListEditor(str, float)
+    qtbot.addWidget(editor)
+
+    add_button = next(
+        button for button in editor.findChildren(QPushButton) if button.text() == "Add"
+    )
+    with qtbot.waitSignal(editor.listChanged):
+        qtbot.mouseClick(add_button, Qt.MouseButton.LeftButton)
+    assert len(editor.list_items()) == 1
+
+    row = editor.list_items()[0]
+    with qtbot.waitSignal(editor.listChanged):
+        row.parameter2().setValue(2.0)
+    with qtbot.waitSignal(editor.listChanged):
+        row.parameter1().editingFinished.emit()
+
+
+def test_union_fields_do_not_break_the_editor(qtbot: QtBot):
+    from xopt.generators import get_generator_defaults
+    from xopt.vocs import VOCS
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+    from badger.gui.utils import filter_generator_config
+
+    vocs = VOCS(variables={"x0": [0, 1]}, objectives={"f": "MINIMIZE"})
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    # gp_constructor.transform_inputs is a Union[Dict[str, bool], bool]
+    name = "time_dependent_upper_confidence_bound"
+    defaults = filter_generator_config(name, get_generator_defaults(name))
+    editor.set_params_from_generator(name, defaults, vocs)
+
+    assert editor.find_widget_at_path(("gp_constructor", "transform_inputs"))
+    assert editor.get_parameters_dict()["beta"] == defaults["beta"]
+
+
+def test_special_field_setup_is_silent(qtbot: QtBot, mocker):
+    from xopt.generators import get_generator_defaults
+    from xopt.vocs import VOCS
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    vocs = VOCS(variables={"x0": [0, 1]}, objectives={"f": "MINIMIZE"})
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    name = "upper_confidence_bound"
+    defaults = get_generator_defaults(name)
+    editor.set_params_from_generator(name, defaults, vocs)
+
+    item = editor.find_widget_at_path(("turbo_controller",))
+    changed = mocker.stub()
+    editor.itemWidget(item, 1).currentIndexChanged.connect(changed)
+    editor.initialize_special_field(defaults, "turbo_controller")
+    changed.assert_not_called()
+
+
+def test_filter_class_fields(qtbot: QtBot):
+    from xopt.generators import get_generator
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    generator_class = get_generator("upper_confidence_bound")
+
+    filtered, removed = BadgerPydanticEditor.filter_class_fields(
+        generator_class, ["vocs"], {"beta": 2.0, "vocs": {}}, include_defaults=True
+    )
+    assert list(filtered) == ["beta"]
+    assert list(removed) == ["vocs"]
+
+    filtered, removed = BadgerPydanticEditor.filter_class_fields(
+        generator_class, ["name", "vocs"]
+    )
+    assert "beta" in filtered and "vocs" not in filtered
+    assert list(removed) == ["vocs"]
+    assert (
+        BadgerPydanticEditor.filter_class_fields(generator_class, ["name", "vocs"])[0]
+        is filtered
+    )
+
+
+def test_resolve_is_cached():
+    from typing import Annotated, Optional, Union
+
+    from badger.gui.components.pydantic_editor import BadgerResolvedType
+
+    resolved = BadgerResolvedType.resolve(Optional[float])
+    assert resolved is BadgerResolvedType.resolve(Optional[float])
+    assert not hasattr(resolved, "__dict__")
+    assert resolved.main is float and resolved.nullable
+
+    # The cached result for the inner type must not pick up nullable
+    assert not BadgerResolvedType.resolve(float).nullable
+
+    # X | None unions resolve like Optional
+    assert BadgerResolvedType.resolve(float | None) == resolved
+    assert BadgerResolvedType.resolve(int | str).main is Union
+
+    # Unhashable metadata is resolved without the cache
+    assert BadgerResolvedType.resolve(Annotated[int, {"unit": "mm"}]).main is int
+
+
+def test_find_primary():
+    from pydantic import BaseModel
+
+    from badger.gui.components.pydantic_editor import BadgerResolvedType
+
+    class Inner(BaseModel):
+        scale: float = 1.0
+
+    def primary(*annotations):
+        return BadgerResolvedType.find_primary(annotations).main
+
+    assert primary(int, Inner, dict[str, int]) is Inner
+    assert primary(bool, int, float) is float
+    assert primary(bool, list[int], dict[str, int]) is dict
+    assert primary(bytes, complex) is bytes
+    assert BadgerResolvedType.find_primary(()) is None
+
+
+def test_model_kind_does_not_keep_classes_alive():
+    import gc
+    import weakref
+    from typing import Union
+
+    from pydantic import create_model
+
+    from badger.gui.components.pydantic_editor import _model_kind
+
+    model = create_model("Transient", value=(int, 1))
+    assert _model_kind(model) == "model"
+    assert _model_kind(int) is None
+    assert _model_kind(Union) is None
+
+    ref = weakref.ref(model)
+    del model
+    gc.collect()
+    assert ref() is None
+
+
+def test_collection_fields(qtbot: QtBot):
+    from pydantic import BaseModel
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    class Collections(BaseModel):
+        steps: list[int] = [1, 2]
+        weights: dict[str, float] = {"a": 0.5}
+
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+    editor.set_params_from_class(Collections)
+
+    expected = {"steps": [1, 2], "weights": {"a": 0.5}}
+    assert json.loads(editor.get_parameters_yaml()) == expected
+    assert editor.get_parameters_dict() == expected
+
+
+def test_resolve_qt_widgets(qtbot: QtBot, mocker):
+    from typing import Optional
+
+    from PyQt5.QtWidgets import (
+        QCheckBox,
+        QDoubleSpinBox,
+        QLabel,
+        QLineEdit,
+        QSpinBox,
+        QTreeWidgetItem,
+    )
+
+    from badger.gui.components.pydantic_editor import (
+        BadgerListEditor,
+        BadgerPydanticEditor,
+        BadgerResolvedType,
+    )
+
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+    validate_item = mocker.patch.object(editor, "validate_item")
+    item = QTreeWidgetItem()
+
+    cases = [
+        (float, 1.5, QDoubleSpinBox),
+        (Optional[int], None, QSpinBox),
+        (bool, True, QCheckBox),
+        (str, "text", QLineEdit),
+        (list[int], [1], BadgerListEditor),
+        (type(None), None, QLabel),
+    ]
+    for annotation, default, widget_type in cases:
+        widget = BadgerResolvedType.resolve_qt(annotation, default, (editor, item))
+        qtbot.addWidget(widget)
+        assert type(widget) is widget_type
+        assert widget.property("badger_nullable") == (annotation == Optional[int])
+
+    widget = BadgerResolvedType.resolve_qt(float, 1.5, (editor, item))
+    qtbot.addWidget(widget)
+    widget.setValue(2.5)
+    validate_item.assert_not_called()
+
+
+def test_edits_are_validated_together(qtbot: QtBot, mocker):
+    from xopt.generators import get_generator_defaults
+    from xopt.vocs import VOCS
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    vocs = VOCS(variables={"x0": [0, 1]}, objectives={"f": "MINIMIZE"})
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+
+    name = "upper_confidence_bound"
+    editor.set_params_from_generator(name, get_generator_defaults(name), vocs)
+    validate_item = mocker.spy(editor, "validate_item")
+
+    item = editor.find_widget_at_path(("beta",))
+    for value in (2.5, 3.0, 3.5):
+        editor.itemWidget(item, 1).setValue(value)
+    assert editor._validation_pending
+    validate_item.assert_not_called()
+
+    qtbot.waitUntil(lambda: validate_item.call_count > 0)
+    validate_item.assert_called_once_with(item)
+
+    # A full validation drops edits still waiting for the timer
+    editor.itemWidget(item, 1).setValue(4.0)
+    editor.validate()
+    qtbot.wait(editor.validation_delay_ms * 2)
+    validate_item.assert_called_once()
+
+
+def test_take_children_deletes_item_widgets(qtbot: QtBot):
+    from pydantic import BaseModel
+    from PyQt5 import sip
+    from PyQt5.QtCore import QCoreApplication, QEvent
+
+    from badger.gui.components.pydantic_editor import BadgerPydanticEditor
+
+    class Inner(BaseModel):
+        scale: float = 2.5
+
+    class Middle(BaseModel):
+        inner: Inner = Inner()
+        count: int = 3
+
+    class Outer(BaseModel):
+        middle: Middle = Middle()
+
+    editor = BadgerPydanticEditor()
+    qtbot.addWidget(editor)
+    editor.set_params_from_class(Outer)
+
+    widgets = [
+        editor.itemWidget(editor.find_widget_at_path(path), 1)
+        for path in (("middle", "count"), ("middle", "inner", "scale"))
+    ]
+    editor._take_children(editor.find_widget_at_path(("middle",)))
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    assert all(sip.isdeleted(widget) for widget in widgets)
+    assert editor.find_widget_at_path(("middle", "inner", "scale")) is None
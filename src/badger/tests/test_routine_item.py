@@ -0,0 +1,188 @@
+from pytestqt.qtbot import QtBot
+
+TIMESTAMP = "2024-05-01T13:45:10.123456"
+
+
+def create_item(environment="sim", env_dict=None, **kwargs):
+    from badger.gui.components.routine_item import BadgerRoutineItem
+
+    return BadgerRoutineItem(
+        "routine-id", "my routine", TIMESTAMP, environment, env_dict or {}, **kwargs
+    )
+
+
+def test_routine_item_init(qtbot: QtBot):
+    from badger.gui.components.eliding_label import ElidingLabel
+    from badger.gui.components.routine_item import _cool_font
+
+    item = create_item()
+    qtbot.addWidget(item)
+
+    # The name font is built once and shared by all the items
+    assert _cool_font() is _cool_font()
+    label = item.findChild(ElidingLabel)
+    assert label.font().pixelSize() == 16
+    assert label.font().weight() == _cool_font().weight()
+
+
+def test_routine_item_timestamp(qtbot: QtBot):
+    from PyQt5.QtWidgets import QLabel
+
+    item = create_item(description="some notes")
+    qtbot.addWidget(item)
+
+    time_str = "05/01/2024, 13:45:10"
+    assert time_str in [label.text() for label in item.findChildren(QLabel)]
+    assert item.tooltip_text() == (
+        f"name: my routine\ncreated at: {time_str}\ndescription:\nsome notes"
+    )
+
+    item.update_description("other notes")
+    assert item.tooltip_text().endswith("description:\nother notes")
+
+
+def test_routine_item_tooltip_on_request(qtbot: QtBot):
+    from PyQt5.QtCore import QEvent, QPoint
+    from PyQt5.QtGui import QHelpEvent
+    from PyQt5.QtWidgets import QApplication, QToolTip
+
+    item = create_item(description="some notes")
+    qtbot.addWidget(item)
+    item.show()
+    assert item.toolTip() == ""
+
+    pos = QPoint(5, 5)
+    QApplication.sendEvent(item, QHelpEvent(QEvent.ToolTip, pos, item.mapToGlobal(pos)))
+    assert QToolTip.text() == item.tooltip_text()
+    QToolTip.hideText()
+
+
+def test_routine_item_stylesheets(qtbot: QtBot):
+    from badger.gui.components.routine_item import stylesheet_normal_default
+
+    env_dict = {
+        "sim": {
+            "normal": "#111111",
+            "normal_hover": "#222222",
+            "activate": "#333333",
+            "activate_hover": "#444444",
+        }
+    }
+    item = create_item(env_dict=env_dict)
+    other = create_item(env_dict=env_dict)
+    default = create_item("other_env", env_dict=env_dict)
+    for widget in (item, other, default):
+        qtbot.addWidget(widget)
+
+    assert "#333333" in item.stylesheet_activate
+    # Items of one environment share the same strings
+    assert other.stylesheet_activate is item.stylesheet_activate
+    assert default.stylesheet_normal is stylesheet_normal_default
+
+
+def test_routine_item_states(qtbot: QtBot):
+    from PyQt5.QtCore import QEvent
+    from PyQt5.QtGui import QColor
+
+    env_dict = {
+        "sim": {
+            "normal": "#111111",
+            "normal_hover": "#222222",
+            "activate": "#333333",
+            "activate_hover": "#444444",
+        }
+    }
+    item = create_item(env_dict=env_dict)
+    qtbot.addWidget(item)
+    item.resize(300, 60)
+    stylesheet = item.styleSheet()
+
+    def background():
+        return item.grab().toImage().pixelColor(100, 30)
+
+    assert item.property("badger_state") == "normal"
+    assert background() == QColor("#111111")
+
+    item.activate()
+    assert item.property("badger_state") == "activate"
+    assert background() == QColor("#333333")
+
+    item.enterEvent(QEvent(QEvent.Enter))
+    qtbot.waitUntil(lambda: item.property("badger_state") == "activate_hover")
+    assert background() == QColor("#444444")
+
+    item.deactivate()
+    item.leaveEvent(QEvent(QEvent.Leave))
+    qtbot.waitUntil(lambda: item.property("badger_state") == "normal")
+    assert background() == QColor("#111111")
+
+    # State changes only flip the property, the stylesheet stays as is
+    assert item.styleSheet() == stylesheet
+
+
+def test_routine_item_buttons(qtbot: QtBot):
+    item = create_item()
+    other = create_item()
+    qtbot.addWidget(item)
+    qtbot.addWidget(other)
+
+    assert item.btn_fav is None
+    # The delete icon is loaded once and shared
+    assert not item.btn_del.icon().isNull()
+    assert item.btn_del.icon().cacheKey() == other.btn_del.icon().cacheKey()
+
+
+def test_routine_item_skips_unchanged_state(qtbot: QtBot):
+    from unittest import mock
+
+    item = create_item()
+    qtbot.addWidget(item)
+
+    with mock.patch.object(item, "style") as style:
+        item.deactivate()
+        item.leaveEvent(None)
+        style.assert_not_called()
+
+        item.activate()
+        style.return_value.polish.assert_called_once_with(item)
+    assert item.property("badger_state") == "activate"
+
+
+def test_routine_item_hover_is_debounced(qtbot: QtBot):
+    from unittest import mock
+
+    item = create_item()
+    qtbot.addWidget(item)
+
+    with mock.patch.object(item, "style") as style:
+        # Passing over the item leaves it as it was
+        item.enterEvent(None)
+        item.leaveEvent(None)
+        qtbot.wait(3 * item.hover_delay_ms)
+        style.assert_not_called()
+
+        item.enterEvent(None)
+        assert item.property("badger_state") == "normal"
+        qtbot.waitUntil(lambda: item.property("badger_state") == "normal_hover")
+        style.return_value.polish.assert_called_once_with(item)
+
+
+def test_routine_item_delete(qtbot: QtBot):
+    from PyQt5.QtWidgets import QMessageBox
+
+    item = create_item()
+    qtbot.addWidget(item)
+    item.show()
+
+    # The confirmation does not block, the answer arrives via a signal
+    item.delete_routine()
+    reply = item.findChild(QMessageBox)
+    assert reply.isVisible()
+    with qtbot.assertNotEmitted(item.sig_del):
+        reply.button(QMessageBox.No).click()
+
+    item.delete_routine()
+    reply = [box for box in item.findChildren(QMessageBox) if box.isVisible()][0]
+    with qtbot.waitSignal(item.sig_del) as blocker:
+        reply.button(QMessageBox.Yes).click()
+    assert blocker.args == ["routine-id"]
@@ -294,3 +294,19 @@ def test_scroll_on_generator_selector(qtbot: QtBot):
 # bounds and initial points wrt the current variable values
 def test_relative_to_current(qtbot: QtBot):
     pass
+
+
+def test_routine_editor_builds_page_lazily(qtbot: QtBot):
+    from badger.gui.components.routine_editor import BadgerRoutineEditor
+    from badger.gui.components.routine_page import BadgerRoutinePage
+
+    editor = BadgerRoutineEditor()
+    qtbot.addWidget(editor)
+    assert editor._routine_page is None
+    assert editor.scroll_area.widget() is None
+
+    editor.set_routine(None)
+    page = editor.routine_page
+    assert isinstance(page, BadgerRoutinePage)
+    assert editor.scroll_area.widget() is page
+    assert editor.routine_page is page